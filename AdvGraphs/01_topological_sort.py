@@ -14,7 +14,10 @@ Or use DFS post-order (reversed).
 TIME: O(V + E)  |  SPACE: O(V)
 """
 
+import heapq
 from collections import deque, defaultdict
+from concurrent.futures import (FIRST_COMPLETED, ProcessPoolExecutor,
+                                ThreadPoolExecutor, wait)
 
 # ============================================
 # PATTERN 1: Kahn's Algorithm (BFS)
@@ -138,6 +141,211 @@ def alien_order(words):
     return "".join(result) if len(result) == len(in_degree) else ""
 
 
+def alien_order_stream(words):
+    """
+    Same as alien_order() but words can be any iterator (e.g. a file:
+    (line.strip() for line in f)). Only the previous word is kept.
+    Letters must be 'a'-'z'; edges live in a 26x26 bitset, where
+    bit j of after[i] means letter i comes before letter j, so
+    duplicate edges cost nothing.
+    """
+    after = [0] * 26
+    seen = 0  # Bitmask of letters that appeared
+    prev = None
+
+    for word in words:
+        for ch in word:
+            seen |= 1 << (ord(ch) - 97)
+
+        if prev is not None:
+            for a, b in zip(prev, word):
+                if a != b:
+                    after[ord(a) - 97] |= 1 << (ord(b) - 97)
+                    break
+            else:
+                # No differing letter: longer word must not come first
+                if len(prev) > len(word):
+                    return ""
+        prev = word
+
+    # Kahn's algorithm over the 26 letters
+    letters = [i for i in range(26) if seen >> i & 1]
+    in_degree = [0] * 26
+    for i in letters:
+        for j in range(26):
+            if after[i] >> j & 1:
+                in_degree[j] += 1
+
+    queue = deque(i for i in letters if in_degree[i] == 0)
+    result = []
+    while queue:
+        i = queue.popleft()
+        result.append(chr(i + 97))
+        for j in range(26):
+            if after[i] >> j & 1:
+                in_degree[j] -= 1
+                if in_degree[j] == 0:
+                    queue.append(j)
+
+    return "".join(result) if len(result) == len(letters) else ""
+
+
+# ============================================
+# PATTERN 5: Incremental Topological Order (Pearce-Kelly)
+# ============================================
+class DynamicTopologicalOrder:
+    """
+    Keep a topological order while edges arrive one at a time.
+    add_edge(u, v) with ord[u] < ord[v] is free. Otherwise only the
+    "affected region" ord[v]..ord[u] is searched and reshuffled:
+    nodes reachable from v (forward) and reaching u (backward) swap
+    into the same set of positions, backward set first.
+    """
+    def __init__(self, n):
+        self.graph = [[] for _ in range(n)]
+        self.reverse = [[] for _ in range(n)]
+        self.ord = list(range(n))        # node -> position
+        self.node_at = list(range(n))    # position -> node
+
+    def add_edge(self, u, v):
+        """Add u -> v. Returns False (edge rejected) if it closes a cycle."""
+        if u == v:
+            return False
+        lo, hi = self.ord[v], self.ord[u]
+        if lo < hi:
+            forward = self._search(v, self.graph, lo, hi, u)
+            if forward is None:
+                return False  # v already reaches u: u -> v closes a cycle
+            backward = self._search(u, self.reverse, lo, hi, None)
+            self._reorder(backward, forward)
+
+        self.graph[u].append(v)
+        self.reverse[v].append(u)
+        return True
+
+    def _search(self, start, adj, lo, hi, stop):
+        """
+        Iterative DFS limited to positions lo..hi (the affected region).
+        Returns the visited set, or None if stop is reached.
+        """
+        ord_ = self.ord
+        seen = {start}
+        stack = [start]
+        while stack:
+            node = stack.pop()
+            for nxt in adj[node]:
+                if nxt == stop:
+                    return None
+                if nxt in seen:
+                    continue
+                if not lo <= ord_[nxt] <= hi:
+                    continue
+                seen.add(nxt)
+                stack.append(nxt)
+        return seen
+
+    def _reorder(self, backward, forward):
+        ord_ = self.ord
+        nodes = sorted(backward, key=ord_.__getitem__) + \
+            sorted(forward, key=ord_.__getitem__)
+        positions = sorted(ord_[x] for x in nodes)
+        for node, pos in zip(nodes, positions):
+            ord_[node] = pos
+            self.node_at[pos] = node
+
+    def order(self):
+        """Current topological order."""
+        return list(self.node_at)
+
+
+# ============================================
+# PATTERN 6: Execution Waves (Level-by-Level Kahn's)
+# ============================================
+def topological_waves(n, edges):
+    """
+    Yield batches of nodes whose prerequisites are all in earlier
+    batches. Nodes in one batch can run concurrently.
+    Stops early (fewer than n nodes yielded) if there is a cycle.
+    """
+    graph = defaultdict(list)
+    in_degree = [0] * n
+    for u, v in edges:
+        graph[u].append(v)
+        in_degree[v] += 1
+
+    wave = [i for i in range(n) if in_degree[i] == 0]
+    while wave:
+        yield wave
+        next_wave = []
+        for node in wave:
+            for neighbor in graph[node]:
+                in_degree[neighbor] -= 1
+                if in_degree[neighbor] == 0:
+                    next_wave.append(neighbor)
+        wave = next_wave
+
+
+def critical_path_lengths(n, edges, cost=None):
+    """
+    length[u] = total cost of the longest path starting at u.
+    Tasks with longer tails should start first. [] if cycle.
+    """
+    order = topological_sort_kahn(n, edges)
+    if len(order) != n:
+        return []
+
+    graph = defaultdict(list)
+    for u, v in edges:
+        graph[u].append(v)
+
+    length = [0] * n
+    for u in reversed(order):
+        tail = max((length[v] for v in graph[u]), default=0)
+        length[u] = (cost[u] if cost else 1) + tail
+    return length
+
+
+def run_dag(n, edges, tasks, max_in_flight=4, cost=None, processes=False):
+    """
+    Run tasks[i]() for every node once its prerequisites finished.
+    At most max_in_flight tasks run at once; among ready tasks the one
+    with the longest critical path is dispatched first.
+    Returns {node: result}, or None if the graph has a cycle.
+    """
+    priority = critical_path_lengths(n, edges, cost)
+    if n and not priority:
+        return None
+
+    graph = defaultdict(list)
+    in_degree = [0] * n
+    for u, v in edges:
+        graph[u].append(v)
+        in_degree[v] += 1
+
+    ready = [(-priority[i], i) for i in range(n) if in_degree[i] == 0]
+    heapq.heapify(ready)
+    results = {}
+    running = {}  # future -> node
+
+    Pool = ProcessPoolExecutor if processes else ThreadPoolExecutor
+    with Pool(max_in_flight) as pool:
+        while ready or running:
+            while ready and len(running) < max_in_flight:
+                _, node = heapq.heappop(ready)
+                running[pool.submit(tasks[node])] = node
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                node = running.pop(future)
+                results[node] = future.result()
+                for neighbor in graph[node]:
+                    in_degree[neighbor] -= 1
+                    if in_degree[neighbor] == 0:
+                        heapq.heappush(ready, (-priority[neighbor], neighbor))
+
+    return results
+
+
 # ============================================
 # KEY PROBLEMS (LeetCode)
 # ============================================
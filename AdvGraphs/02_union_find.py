@@ -8,45 +8,30 @@ WHEN TO USE:
 - Detect cycle in undirected graph
 - Grouping elements
 
-KEY INSIGHT: Use path compression + union by rank for near O(1) operations.
+KEY INSIGHT: Use path compression (halving) + union by size for near O(1) operations.
 
 TIME: O(α(n)) ≈ O(1) amortized  |  SPACE: O(n)
 """
 
+import os
+import sys
+from array import array
+from collections import defaultdict
+
+# graph_helpers.py at the repo root, ahead of anything else on sys.path
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if sys.path[:1] != [_ROOT]:
+    sys.path.insert(0, _ROOT)
+from graph_helpers import UnionFind  # noqa: E402
+
 # ============================================
 # PATTERN 1: Basic Union-Find
 # ============================================
-class UnionFind:
-    def __init__(self, n):
-        self.parent = list(range(n))
-        self.rank = [0] * n
-        self.count = n  # Number of components
-
-    def find(self, x):
-        """Find root with path compression."""
-        if self.parent[x] != x:
-            self.parent[x] = self.find(self.parent[x])
-        return self.parent[x]
-
-    def union(self, x, y):
-        """Union by rank. Returns True if merged."""
-        px, py = self.find(x), self.find(y)
-        if px == py:
-            return False
-
-        # Attach smaller tree under larger
-        if self.rank[px] < self.rank[py]:
-            px, py = py, px
-        self.parent[py] = px
-        if self.rank[px] == self.rank[py]:
-            self.rank[px] += 1
-
-        self.count -= 1
-        return True
-
-    def connected(self, x, y):
-        """Check if x and y are in same set."""
-        return self.find(x) == self.find(y)
+# UnionFind is shared with the MST patterns and lives in graph_helpers.py:
+# - find(x): iterative path halving (parent[x] = parent[parent[x]])
+# - union(x, y): attach smaller tree under larger (union by size)
+# - count: number of components
+# - union_many(edges), find_many(xs), labels() for batches
 
 
 # ============================================
@@ -131,6 +116,128 @@ def longest_consecutive(nums):
     return max(Counter(roots).values())
 
 
+# ============================================
+# PATTERN 6: Union-Find with Rollback
+# ============================================
+class RollbackUnionFind:
+    """
+    Union by rank, NO path compression: every union changes O(1) cells,
+    so it can be undone. find() is O(log n).
+    """
+    def __init__(self, n):
+        self.parent = array('i', range(n))
+        self.rank = array('i', [0]) * n
+        self.count = n
+        self.history = []  # (attached root, rank bumped?) per union
+
+    def find(self, x):
+        parent = self.parent
+        while parent[x] != x:
+            x = parent[x]
+        return x
+
+    def union(self, x, y):
+        px, py = self.find(x), self.find(y)
+        if px == py:
+            return False
+        if self.rank[px] < self.rank[py]:
+            px, py = py, px
+        bumped = self.rank[px] == self.rank[py]
+        self.parent[py] = px
+        if bumped:
+            self.rank[px] += 1
+        self.count -= 1
+        self.history.append((py, bumped))
+        return True
+
+    def connected(self, x, y):
+        return self.find(x) == self.find(y)
+
+    def snapshot(self):
+        """Token for the current state."""
+        return len(self.history)
+
+    def rollback(self, token):
+        """Undo every union made after snapshot() returned token."""
+        while len(self.history) > token:
+            py, bumped = self.history.pop()
+            px = self.parent[py]
+            self.parent[py] = py
+            if bumped:
+                self.rank[px] -= 1
+            self.count += 1
+
+
+# ============================================
+# PATTERN 7: Offline Dynamic Connectivity
+# ============================================
+def offline_dynamic_connectivity(n, events):
+    """
+    events[t] = ('add', u, v) | ('remove', u, v) | ('query', u, v)
+    Return [connected?] for each query, in order.
+
+    Trick: each edge is alive on a time interval. Put it on the
+    O(log T) segment-tree nodes covering that interval, then DFS the
+    tree: union on entry, rollback on exit. Leaves see exactly the
+    edges alive at that time.
+
+    Raises ValueError for a 'remove' with no matching open 'add'.
+    """
+    T = len(events)
+    if T == 0:
+        return []
+
+    # Buckets are created only for segment-tree nodes that get an edge
+    tree = defaultdict(list)
+
+    def add_interval(node, lo, hi, left, right, edge):
+        if right <= lo or hi <= left:
+            return
+        if left <= lo and hi <= right:
+            tree[node].append(edge)
+            return
+        mid = (lo + hi) // 2
+        add_interval(2 * node, lo, mid, left, right, edge)
+        add_interval(2 * node + 1, mid, hi, left, right, edge)
+
+    # Edge -> start times of currently open intervals (multi-edges allowed)
+    open_since = {}
+    for t, (op, u, v) in enumerate(events):
+        edge = (min(u, v), max(u, v))
+        if op == 'add':
+            open_since.setdefault(edge, []).append(t)
+        elif op == 'remove':
+            if not open_since.get(edge):
+                raise ValueError(
+                    f"event {t}: remove of edge {edge} that is not present")
+            add_interval(1, 0, T, open_since[edge].pop(), t, edge)
+    for edge, starts in open_since.items():
+        for start in starts:
+            add_interval(1, 0, T, start, T, edge)
+
+    uf = RollbackUnionFind(n)
+    answers = []
+
+    def dfs(node, lo, hi):
+        token = uf.snapshot()
+        for u, v in tree.get(node, ()):
+            uf.union(u, v)
+
+        if hi - lo == 1:
+            op, u, v = events[lo]
+            if op == 'query':
+                answers.append(uf.connected(u, v))
+        else:
+            mid = (lo + hi) // 2
+            dfs(2 * node, lo, mid)
+            dfs(2 * node + 1, mid, hi)
+
+        uf.rollback(token)
+
+    dfs(1, 0, T)
+    return answers
+
+
 # ============================================
 # KEY PROBLEMS (LeetCode)
 # ============================================
@@ -14,32 +14,27 @@ TIME: O((V + E) log V)  |  SPACE: O(V)
 """
 
 import heapq
-from collections import defaultdict
+import json
+import os
+import sys
+from collections import defaultdict, deque
+
+# graph_helpers.py at the repo root, ahead of anything else on sys.path
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if sys.path[:1] != [_ROOT]:
+    sys.path.insert(0, _ROOT)
+# dijkstra and bellman_ford are re-exported as this file's patterns
+from graph_helpers import (  # noqa: E402,F401
+    IndexedMinHeap, bellman_ford, dijkstra, semiring_path)
 
 # ============================================
 # PATTERN 1: Basic Dijkstra
 # ============================================
-def dijkstra(graph, start, n):
-    """
-    Find shortest distances from start to all nodes.
-    graph[u] = [(v, weight), ...]
-    """
-    dist = [float('inf')] * n
-    dist[start] = 0
-    heap = [(0, start)]  # (distance, node)
-
-    while heap:
-        d, u = heapq.heappop(heap)
-
-        if d > dist[u]:
-            continue  # Skip outdated entry
-
-        for v, weight in graph[u]:
-            if dist[u] + weight < dist[v]:
-                dist[v] = dist[u] + weight
-                heapq.heappush(heap, (dist[v], v))
-
-    return dist
+# dijkstra(graph, start, n) lives in graph_helpers.py (imported above)
+# so the all-pairs file (AdvGraphs/05) runs the same loop:
+#   dist = [inf] * n; dist[start] = 0; heap = [(0, start)]
+#   pop (d, u); skip if d > dist[u] (outdated entry);
+#   relax every (v, weight) in graph[u], pushing improved nodes.
 
 
 # ============================================
@@ -75,8 +70,14 @@ def network_delay_time(times, n, k):
 # ============================================
 # PATTERN 3: Cheapest Flights Within K Stops
 # ============================================
-def find_cheapest_price(n, flights, src, dst, k):
-    """Find cheapest price with at most k stops."""
+def find_cheapest_price(n, flights, src, dst, k, backend='heap'):
+    """
+    Find cheapest price with at most k stops.
+    backend='bellman_ford' uses the k-round relaxation in PATTERN 13.
+    """
+    if backend == 'bellman_ford':
+        return find_cheapest_price_bf(n, flights, src, dst, k)
+
     graph = defaultdict(list)
     for u, v, price in flights:
         graph[u].append((v, price))
@@ -109,34 +110,13 @@ def find_cheapest_price(n, flights, src, dst, k):
 # PATTERN 4: Path with Maximum Probability
 # ============================================
 def max_probability(n, edges, probs, start, end):
-    """Find path with maximum success probability."""
-    graph = defaultdict(list)
-    for (u, v), p in zip(edges, probs):
-        graph[u].append((v, p))
-        graph[v].append((u, p))
-
-    # Max-heap (negate for max behavior)
-    max_prob = [0.0] * n
-    max_prob[start] = 1.0
-    heap = [(-1.0, start)]
-
-    while heap:
-        neg_prob, node = heapq.heappop(heap)
-        prob = -neg_prob
-
-        if node == end:
-            return prob
-
-        if prob < max_prob[node]:
-            continue
-
-        for neighbor, edge_prob in graph[node]:
-            new_prob = prob * edge_prob
-            if new_prob > max_prob[neighbor]:
-                max_prob[neighbor] = new_prob
-                heapq.heappush(heap, (-new_prob, neighbor))
-
-    return 0.0
+    """
+    Find path with maximum success probability.
+    Max-times semiring in log space (semiring_path, graph_helpers.py),
+    so path comparisons don't underflow on long paths.
+    """
+    return semiring_path(n, [(u, v, p) for (u, v), p in zip(edges, probs)],
+                         start, end, 'max_times')
 
 
 # ============================================
@@ -171,6 +151,731 @@ def shortest_path(grid, k):
     return -1
 
 
+# ============================================
+# PATTERN 6: Dijkstra on a CSR Graph
+# ============================================
+def dijkstra_csr(csr, start):
+    """
+    Same as dijkstra() but reads edges straight from a CSRGraph
+    (graph_helpers.py), e.g. CSRGraph(n, build_weighted_graph(...)).
+    """
+    offsets, targets, weights = csr.offsets, csr.targets, csr.weights
+    dist = [float('inf')] * csr.n
+    dist[start] = 0
+    heap = [(0, start)]
+
+    while heap:
+        d, u = heapq.heappop(heap)
+        if d > dist[u]:
+            continue
+
+        for i in range(offsets[u], offsets[u + 1]):
+            v = targets[i]
+            nd = d + weights[i]
+            if nd < dist[v]:
+                dist[v] = nd
+                heapq.heappush(heap, (nd, v))
+
+    return dist
+
+
+# ============================================
+# PATTERN 7: Dijkstra with Decrease-Key
+# ============================================
+def dijkstra_indexed(graph, start, n, d=2):
+    """
+    Dijkstra without lazy deletion: relaxing an edge lowers the
+    node's key in place (IndexedMinHeap, graph_helpers.py), so the
+    heap holds at most n entries.
+
+    Use it when memory is the limit on dense graphs (average degree in
+    the hundreds), where the lazy heap piles up stale entries. On sparse
+    graphs plain dijkstra() is several times faster: heapq is C code,
+    and this heap sifts in Python (see benchmarks/indexed_heap.py).
+    """
+    dist = [float('inf')] * n
+    dist[start] = 0
+    heap = IndexedMinHeap(n, d)
+    heap.push(start, 0)
+
+    while heap:
+        u, d_u = heap.pop()
+
+        for v, weight in graph[u]:
+            if d_u + weight < dist[v]:
+                dist[v] = d_u + weight
+                heap.push(v, dist[v])
+
+    return dist
+
+
+# ============================================
+# PATTERN 8: Bidirectional Dijkstra (Point-to-Point Queries)
+# ============================================
+class ShortestPathQueries:
+    """
+    Answer many (s, t) queries against one graph.
+    Each query grows a forward search from s and a backward search
+    from t (on the reversed graph) and stops once they can no longer
+    improve the best meeting point. Distance arrays are allocated once
+    and only the entries a query touched are reset afterwards.
+    """
+    def __init__(self, graph, n):
+        """graph[u] = [(v, weight), ...] (directed)."""
+        self.n = n
+        self.forward = [[] for _ in range(n)]
+        self.backward = [[] for _ in range(n)]
+        is_dict = isinstance(graph, dict)
+        for u in range(n):
+            for v, weight in (graph.get(u, ()) if is_dict else graph[u]):
+                self.forward[u].append((v, weight))
+                self.backward[v].append((u, weight))
+
+        self.dist_f = [float('inf')] * n
+        self.dist_b = [float('inf')] * n
+        self.touched = []
+
+    def query(self, s, t):
+        """Shortest distance from s to t (inf if unreachable)."""
+        if s == t:
+            return 0
+
+        dist_f, dist_b, touched = self.dist_f, self.dist_b, self.touched
+        dist_f[s] = 0
+        dist_b[t] = 0
+        touched.extend((s, t))
+        heap_f = [(0, s)]
+        heap_b = [(0, t)]
+        best = float('inf')
+
+        while heap_f and heap_b:
+            # Neither side can find a shorter meeting point any more
+            if heap_f[0][0] + heap_b[0][0] >= best:
+                break
+
+            # Expand the smaller frontier
+            if len(heap_f) <= len(heap_b):
+                heap, dist, other, adj = heap_f, dist_f, dist_b, self.forward
+            else:
+                heap, dist, other, adj = heap_b, dist_b, dist_f, self.backward
+
+            d, u = heapq.heappop(heap)
+            if d > dist[u]:
+                continue
+
+            for v, weight in adj[u]:
+                nd = d + weight
+                if nd < dist[v]:
+                    if dist[v] == float('inf') and other[v] == float('inf'):
+                        touched.append(v)
+                    dist[v] = nd
+                    heapq.heappush(heap, (nd, v))
+                if nd + other[v] < best:
+                    best = nd + other[v]
+
+        # Reset only what this query wrote
+        for node in touched:
+            dist_f[node] = dist_b[node] = float('inf')
+        touched.clear()
+
+        return best
+
+    def query_many(self, pairs):
+        """Answer a batch of (s, t) pairs, reusing the scratch arrays."""
+        return [self.query(s, t) for s, t in pairs]
+
+
+# ============================================
+# PATTERN 9: Contraction Hierarchies
+# ============================================
+class ContractionHierarchy:
+    """
+    Preprocess once, then answer s-t queries touching only a small
+    "upward" part of the graph.
+
+    Build: contract nodes one at a time (least important first). When v
+    is removed, add shortcut u -> x for every in/out neighbor pair whose
+    shortest path went through v (no witness path avoids v).
+    Query: bidirectional Dijkstra that only follows edges toward
+    higher-ranked nodes; the best meeting node gives the distance.
+    """
+    def __init__(self, graph=None, n=0, witness_limit=50):
+        """graph[u] = [(v, weight), ...] (directed)."""
+        self.n = n
+        self.rank = [0] * n
+        self.up = [[] for _ in range(n)]    # u -> v, rank[v] > rank[u]
+        self.down = [[] for _ in range(n)]  # v <- u, rank[u] > rank[v]
+        if graph is not None:
+            self._build(graph, witness_limit)
+
+    def _build(self, graph, witness_limit):
+        n = self.n
+        out_adj = [{} for _ in range(n)]
+        in_adj = [{} for _ in range(n)]
+        is_dict = isinstance(graph, dict)
+        for u in range(n):
+            for v, weight in (graph.get(u, ()) if is_dict else graph[u]):
+                if u != v and weight < out_adj[u].get(v, float('inf')):
+                    out_adj[u][v] = weight
+                    in_adj[v][u] = weight
+
+        def witness(source, skip, targets):
+            """
+            Bounded Dijkstra from source that avoids skip. Stops once
+            every target is settled or nothing left can beat the
+            longest path through skip.
+            """
+            limit = max(targets.values())
+            pending = len(targets)
+            dist = {source: 0}
+            heap = [(0, source)]
+            settled = 0
+            while heap:
+                d, u = heapq.heappop(heap)
+                if d > dist[u]:
+                    continue
+                if d > limit or settled == witness_limit:
+                    break
+                if u in targets:
+                    pending -= 1
+                    if not pending:
+                        break
+                settled += 1
+                for x, w in out_adj[u].items():
+                    if x != skip and d + w < dist.get(x, float('inf')):
+                        dist[x] = d + w
+                        heapq.heappush(heap, (d + w, x))
+            return dist
+
+        def shortcuts(v):
+            """Shortcuts needed if v were contracted now."""
+            needed = []
+            for u, w_in in in_adj[v].items():
+                targets = {x: w_in + w_out for x, w_out in out_adj[v].items()
+                           if x != u}
+                if not targets:
+                    continue
+                dist = witness(u, v, targets)
+                for x, via_v in targets.items():
+                    if dist.get(x, float('inf')) > via_v:
+                        needed.append((u, x, via_v))
+            return needed
+
+        deleted_neighbors = [0] * n
+
+        def priority(v):
+            """(priority, shortcuts) if v were contracted now."""
+            # Edge difference + spread contraction evenly over the graph
+            added = shortcuts(v)
+            edges_removed = len(in_adj[v]) + len(out_adj[v])
+            return len(added) - edges_removed + deleted_neighbors[v], added
+
+        heap = [(priority(v)[0], v) for v in range(n)]
+        heapq.heapify(heap)
+        order = 0
+
+        while heap:
+            _, v = heapq.heappop(heap)
+            # Lazy update: re-evaluate, contract only if still the minimum.
+            # The witness searches behind p give the shortcuts to add.
+            p, added = priority(v)
+            if heap and p > heap[0][0]:
+                heapq.heappush(heap, (p, v))
+                continue
+
+            self.rank[v] = order
+            order += 1
+
+            # Every remaining neighbor outranks v
+            for x, w in out_adj[v].items():
+                self.up[v].append((x, w))
+                del in_adj[x][v]
+                deleted_neighbors[x] += 1
+            for u, w in in_adj[v].items():
+                self.down[v].append((u, w))
+                del out_adj[u][v]
+                deleted_neighbors[u] += 1
+            out_adj[v].clear()
+            in_adj[v].clear()
+
+            for u, x, weight in added:
+                if weight < out_adj[u].get(x, float('inf')):
+                    out_adj[u][x] = weight
+                    in_adj[x][u] = weight
+
+    def query(self, s, t):
+        """Shortest distance from s to t (inf if unreachable)."""
+        dist_f, dist_b = {s: 0}, {t: 0}
+        heap_f, heap_b = [(0, s)], [(0, t)]
+        best = 0 if s == t else float('inf')
+
+        while heap_f or heap_b:
+            for heap, dist, other, adj in ((heap_f, dist_f, dist_b, self.up),
+                                           (heap_b, dist_b, dist_f, self.down)):
+                if not heap:
+                    continue
+                d, u = heapq.heappop(heap)
+                if d > dist[u]:
+                    continue
+                if d >= best:
+                    heap.clear()  # This side cannot improve best
+                    continue
+                if u in other:
+                    best = min(best, d + other[u])
+
+                for v, weight in adj[u]:
+                    if d + weight < dist.get(v, float('inf')):
+                        dist[v] = d + weight
+                        heapq.heappush(heap, (d + weight, v))
+
+        return best
+
+    def save(self, path):
+        """Write the index to disk so preprocessing is paid once."""
+        with open(path, 'w') as f:
+            json.dump({'n': self.n, 'rank': self.rank,
+                       'up': self.up, 'down': self.down}, f)
+
+    @classmethod
+    def load(cls, path):
+        with open(path) as f:
+            data = json.load(f)
+        ch = cls(n=data['n'])
+        ch.rank = data['rank']
+        ch.up = [[tuple(e) for e in edges] for edges in data['up']]
+        ch.down = [[tuple(e) for e in edges] for edges in data['down']]
+        return ch
+
+
+# ============================================
+# PATTERN 10: Small Integer Weights (0-1 BFS / Dial's)
+# ============================================
+def zero_one_bfs(graph, start, n):
+    """
+    Shortest paths when every weight is 0 or 1.
+    Deque instead of heap: 0-edges go to the front, 1-edges to the back.
+    """
+    dist = [float('inf')] * n
+    dist[start] = 0
+    queue = deque([start])
+
+    while queue:
+        u = queue.popleft()
+        for v, weight in graph[u]:
+            if dist[u] + weight < dist[v]:
+                dist[v] = dist[u] + weight
+                if weight == 0:
+                    queue.appendleft(v)
+                else:
+                    queue.append(v)
+
+    return dist
+
+
+def dijkstra_dial(graph, start, n, max_weight):
+    """
+    Dial's algorithm: bucket queue for integer weights in [0, max_weight].
+    Only max_weight + 1 distances can be pending at once, so buckets
+    are reused circularly. O(V * max_weight + E), no log factor.
+    """
+    dist = [float('inf')] * n
+    dist[start] = 0
+    size = max_weight + 1
+    buckets = [[] for _ in range(size)]
+    buckets[0].append(start)
+    pending = 1
+    d = 0
+
+    while pending:
+        bucket = buckets[d % size]
+        while bucket:
+            u = bucket.pop()
+            pending -= 1
+            if dist[u] != d:
+                continue  # Outdated entry
+
+            for v, weight in graph[u]:
+                if d + weight < dist[v]:
+                    dist[v] = d + weight
+                    buckets[int(dist[v]) % size].append(v)  # 3.0 -> 3
+                    pending += 1
+        d += 1
+
+    return dist
+
+
+def small_int_max_weight(graph, n, max_bucket_weight=1000):
+    """
+    Largest weight if every weight is a whole number in
+    [0, max_bucket_weight], else None. Collects the distinct weights
+    in one pass and checks each only once (few when weights are small).
+    """
+    distinct = set()
+    for u in range(n):
+        distinct.update([weight for _, weight in graph[u]])
+
+    for weight in distinct:
+        # is_integer() is False for inf/nan, so those fall back too
+        if (not float(weight).is_integer() or weight < 0
+                or weight > max_bucket_weight):
+            return None
+    return int(max(distinct, default=0))
+
+
+class AutoDijkstra:
+    """
+    Pick the queue from the weights once per graph: 0-1 BFS for 0/1
+    weights, Dial's buckets for small non-negative integers, binary
+    heap otherwise. distances() then runs the chosen one per source.
+    """
+    def __init__(self, graph, n, max_bucket_weight=1000):
+        self.graph = graph
+        self.n = n
+        self.max_weight = small_int_max_weight(graph, n, max_bucket_weight)
+
+    def distances(self, start):
+        if self.max_weight is None:
+            return dijkstra(self.graph, start, self.n)
+        if self.max_weight <= 1:
+            return zero_one_bfs(self.graph, start, self.n)
+        return dijkstra_dial(self.graph, start, self.n, self.max_weight)
+
+
+def dijkstra_auto(graph, start, n, max_bucket_weight=1000):
+    """
+    One-off AutoDijkstra query. For many sources on the same graph keep
+    one AutoDijkstra, so the weights are only scanned once.
+    """
+    return AutoDijkstra(graph, n, max_bucket_weight).distances(start)
+
+
+# ============================================
+# PATTERN 11: A* Search (Manhattan and ALT Heuristics)
+# ============================================
+def astar(graph, start, target, n, heuristic, stats=None):
+    """
+    Dijkstra ordered by dist + heuristic(node). With an admissible,
+    consistent heuristic (never overestimates) the first time target
+    is popped its distance is final, and far fewer nodes are expanded.
+    stats (optional dict) receives the number of expanded nodes.
+    """
+    dist = [float('inf')] * n
+    dist[start] = 0
+    heap = [(heuristic(start), 0, start)]  # (f = g + h, g, node)
+    expanded = 0
+
+    while heap:
+        _, d, u = heapq.heappop(heap)
+        if d > dist[u]:
+            continue
+        expanded += 1
+        if u == target:
+            break
+
+        for v, weight in graph[u]:
+            if d + weight < dist[v]:
+                dist[v] = d + weight
+                heapq.heappush(heap, (dist[v] + heuristic(v), dist[v], v))
+
+    if stats is not None:
+        stats['expanded'] = expanded
+    return dist[target]
+
+
+class Landmarks:
+    """
+    ALT heuristic: precompute exact distances to/from a few landmarks.
+    Triangle inequality gives d(u, t) >= d(L, t) - d(L, u)
+    and d(u, t) >= d(u, L) - d(t, L) for every landmark L.
+    """
+    def __init__(self, graph, n, count=4):
+        reverse = [[] for _ in range(n)]
+        for u in range(n):
+            for v, weight in graph[u]:
+                reverse[v].append((u, weight))
+
+        # Farthest-point selection spreads landmarks over the graph
+        self.dist_from, self.dist_to = [], []
+        closest = [float('inf')] * n
+        landmark = 0
+        for _ in range(min(count, n)):
+            self.dist_from.append(dijkstra(graph, landmark, n))
+            self.dist_to.append(dijkstra(reverse, landmark, n))
+            for u in range(n):
+                d = self.dist_from[-1][u]
+                closest[u] = min(closest[u], d if d < float('inf') else 0)
+            landmark = max(range(n), key=closest.__getitem__)
+
+    def heuristic(self, target):
+        """Admissible h(u) for queries toward target."""
+        pairs = [(d_from, d_to, d_from[target], d_to[target])
+                 for d_from, d_to in zip(self.dist_from, self.dist_to)]
+
+        def h(u):
+            best = 0
+            for d_from, d_to, from_t, to_t in pairs:
+                # Skip bounds that involve unreachable (inf) terms
+                if from_t < float('inf') and d_from[u] < float('inf'):
+                    best = max(best, from_t - d_from[u])
+                if d_to[u] < float('inf') and to_t < float('inf'):
+                    best = max(best, d_to[u] - to_t)
+            return best
+        return h
+
+
+def shortest_path_astar(grid, k, stats=None):
+    """
+    shortest_path() as A* with the Manhattan heuristic and dominance
+    pruning: state (r, c, obs) is useless if the same cell was already
+    reached with at least as many eliminations left in no more steps.
+    """
+    rows, cols = len(grid), len(grid[0])
+    if rows == 1 and cols == 1:
+        return 0
+    # Enough eliminations to walk straight there
+    if k >= rows + cols - 3 and grid[rows - 1][cols - 1] == 0:
+        return rows + cols - 2
+
+    def h(r, c):
+        return (rows - 1 - r) + (cols - 1 - c)
+
+    # (f, steps, row, col, obstacles_left)
+    heap = [(h(0, 0), 0, 0, 0, k)]
+    # Per cell: non-dominated (steps, obstacles_left) pairs seen
+    frontier = [[[] for _ in range(cols)] for _ in range(rows)]
+    frontier[0][0].append((0, k))
+    expanded = 0
+
+    def dominated(r, c, steps, obs):
+        return any(s <= steps and o >= obs for s, o in frontier[r][c])
+
+    result = -1
+    while heap:
+        _, steps, r, c, obs = heapq.heappop(heap)
+        expanded += 1
+        if r == rows - 1 and c == cols - 1:
+            result = steps
+            break
+
+        for dr, dc in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
+            nr, nc = r + dr, c + dc
+            if 0 <= nr < rows and 0 <= nc < cols:
+                new_obs = obs - grid[nr][nc]
+                if new_obs < 0 or dominated(nr, nc, steps + 1, new_obs):
+                    continue
+                cell = frontier[nr][nc]
+                cell[:] = [(s, o) for s, o in cell
+                           if not (s >= steps + 1 and o <= new_obs)]
+                cell.append((steps + 1, new_obs))
+                heapq.heappush(heap, (steps + 1 + h(nr, nc), steps + 1,
+                                      nr, nc, new_obs))
+
+    if stats is not None:
+        stats['expanded'] = expanded
+    return result
+
+
+# ============================================
+# PATTERN 12: K Shortest Simple Paths (Yen's)
+# ============================================
+def dijkstra_path(graph, start, target, n, banned_nodes=(), banned_edges=(),
+                  potential=None):
+    """
+    Shortest start -> target path skipping banned nodes/edges
+    (sets of node / (u, v)), without copying the graph.
+    potential (optional): potential[u] <= true distance u -> target,
+    e.g. exact distances in the unbanned graph. The search then runs as
+    A* and skips nodes whose potential is inf (target unreachable).
+    Returns (distance, path) or (inf, []) if unreachable.
+    """
+    dist = [float('inf')] * n
+    parent = [-1] * n  # Predecessor array for path reconstruction
+    h = potential or [0] * n
+    dist[start] = 0
+    heap = [(h[start], 0, start)]
+
+    while heap:
+        _, d, u = heapq.heappop(heap)
+        if d > dist[u]:
+            continue
+        if u == target:
+            break
+
+        for v, weight in graph[u]:
+            if v in banned_nodes or (u, v) in banned_edges:
+                continue
+            if d + weight < dist[v] and h[v] < float('inf'):
+                dist[v] = d + weight
+                parent[v] = u
+                heapq.heappush(heap, (dist[v] + h[v], dist[v], v))
+
+    if dist[target] == float('inf'):
+        return float('inf'), []
+
+    path = [target]
+    while path[-1] != start:
+        path.append(parent[path[-1]])
+    return dist[target], path[::-1]
+
+
+def k_shortest_paths(graph, start, target, n, k):
+    """
+    Yen's algorithm: up to k loopless paths in increasing cost.
+    Each new path = root (prefix of an accepted path) + spur (shortest
+    detour from the root's last node). Edges used by accepted paths
+    sharing the same root and nodes of the root are banned for the spur.
+
+    Spur searches reuse one reverse shortest-path tree toward target:
+    if the tree path from the spur node avoids every ban it is the
+    spur, with no search at all; otherwise its distances guide an A*
+    spur search (dijkstra_path's potential).
+    Returns [(cost, path), ...].
+    """
+    if k <= 0:
+        return []
+
+    # Reverse shortest-path tree: to_target[u] = distance u -> target,
+    # next_hop[u] = u's successor on that path. Also the cheapest
+    # weight per directed edge, to price root prefixes.
+    reverse = [[] for _ in range(n)]
+    weight_of = {}
+    for u in range(n):
+        for v, weight in graph[u]:
+            reverse[v].append((u, weight))
+            if weight < weight_of.get((u, v), float('inf')):
+                weight_of[(u, v)] = weight
+
+    to_target = [float('inf')] * n
+    next_hop = [-1] * n
+    to_target[target] = 0
+    heap = [(0, target)]
+    while heap:
+        d, v = heapq.heappop(heap)
+        if d > to_target[v]:
+            continue
+        for u, weight in reverse[v]:
+            if d + weight < to_target[u]:
+                to_target[u] = d + weight
+                next_hop[u] = v
+                heapq.heappush(heap, (d + weight, u))
+
+    def tree_spur(spur_node, banned_nodes, banned_edges):
+        """Tree path spur_node -> target if it avoids the bans."""
+        path = [spur_node]
+        while path[-1] != target:
+            nxt = next_hop[path[-1]]
+            if nxt in banned_nodes or (path[-1], nxt) in banned_edges:
+                return None
+            path.append(nxt)
+        return path
+
+    if to_target[start] == float('inf'):
+        return []
+    path = tree_spur(start, (), ())
+    accepted = [(to_target[start], path)]
+    candidates = []  # Heap of (cost, path)
+    seen = {tuple(path)}
+
+    while len(accepted) < k:
+        _, last = accepted[-1]
+        root_cost = 0
+
+        # Spur from every node of the last accepted path but the target
+        for i in range(len(last) - 1):
+            spur_node = last[i]
+            root = last[:i + 1]
+
+            banned_edges = {(p[i], p[i + 1]) for _, p in accepted
+                            if len(p) > i + 1 and p[:i + 1] == root}
+            banned_nodes = set(root[:-1])
+
+            spur = tree_spur(spur_node, banned_nodes, banned_edges)
+            if spur is not None:
+                spur_cost = to_target[spur_node]
+            else:
+                spur_cost, spur = dijkstra_path(graph, spur_node, target, n,
+                                                banned_nodes, banned_edges,
+                                                to_target)
+            if spur:
+                candidate = root[:-1] + spur
+                if tuple(candidate) not in seen:
+                    seen.add(tuple(candidate))
+                    heapq.heappush(candidates, (root_cost + spur_cost, candidate))
+
+            # Root cost grows incrementally instead of being re-summed
+            root_cost += weight_of[(last[i], last[i + 1])]
+
+        if not candidates:
+            break
+        accepted.append(heapq.heappop(candidates))
+
+    return accepted
+
+
+# ============================================
+# PATTERN 13: Bellman-Ford / SPFA (Negative Weights)
+# ============================================
+def find_cheapest_price_bf(n, flights, src, dst, k):
+    """
+    At most k stops = at most k + 1 edges = k + 1 rounds of relaxing
+    every edge. Each round reads only the previous round's prices so
+    a round never chains two flights. A plain k-round loop over the
+    flight list: O(k * E), no heap. Accepts the same prices
+    (int or float) as the heap version.
+    """
+    cost = [float('inf')] * n
+    cost[src] = 0
+
+    for _ in range(k + 1):
+        prev = cost[:]
+        changed = False
+        for u, v, price in flights:
+            if prev[u] + price < cost[v]:
+                cost[v] = prev[u] + price
+                changed = True
+        if not changed:
+            break
+
+    return cost[dst] if cost[dst] < float('inf') else -1
+
+
+# bellman_ford(n, edges, start) also lives in graph_helpers.py: n - 1
+# rounds of relaxing every edge (stopping early when a round changes
+# nothing), then one more round; any improvement = negative cycle
+# (returns None). start=None gives Johnson's potentials.
+
+
+def spfa(graph, start, n):
+    """
+    Queue-based Bellman-Ford: only re-relax nodes whose distance
+    changed. graph[u] = [(v, weight), ...]
+    A shortest path uses at most n - 1 edges, so a path of n edges
+    means a negative cycle (returns None).
+    """
+    dist = [float('inf')] * n
+    edges_on_path = [0] * n
+    in_queue = [False] * n
+    dist[start] = 0
+    queue = deque([start])
+    in_queue[start] = True
+
+    while queue:
+        u = queue.popleft()
+        in_queue[u] = False
+
+        for v, weight in graph[u]:
+            if dist[u] + weight < dist[v]:
+                dist[v] = dist[u] + weight
+                edges_on_path[v] = edges_on_path[u] + 1
+                if edges_on_path[v] >= n:
+                    return None
+                if not in_queue[v]:
+                    in_queue[v] = True
+                    queue.append(v)
+
+    return dist
+
+
 # ============================================
 # KEY PROBLEMS (LeetCode)
 # ============================================
@@ -15,32 +15,17 @@ TIME: O(E log E) or O(E log V)  |  SPACE: O(V)
 """
 
 import heapq
+import os
+import sys
+from array import array
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 
-# ============================================
-# Union-Find for Kruskal's
-# ============================================
-class UnionFind:
-    def __init__(self, n):
-        self.parent = list(range(n))
-        self.rank = [0] * n
-
-    def find(self, x):
-        if self.parent[x] != x:
-            self.parent[x] = self.find(self.parent[x])
-        return self.parent[x]
-
-    def union(self, x, y):
-        px, py = self.find(x), self.find(y)
-        if px == py:
-            return False
-        if self.rank[px] < self.rank[py]:
-            px, py = py, px
-        self.parent[py] = px
-        if self.rank[px] == self.rank[py]:
-            self.rank[px] += 1
-        return True
-
+# graph_helpers.py at the repo root, ahead of anything else on sys.path
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if sys.path[:1] != [_ROOT]:
+    sys.path.insert(0, _ROOT)
+from graph_helpers import IndexedMinHeap, UnionFind  # noqa: E402
 
 # ============================================
 # PATTERN 1: Kruskal's Algorithm
@@ -120,6 +105,99 @@ def min_cost_connect_points(points):
     return kruskal(n, edges)
 
 
+def min_cost_connect_points_dense(points):
+    """
+    Dense Prim's: O(n^2) time, O(n) space, never stores the edge list.
+    min_dist[j] = cheapest edge from the tree to point j.
+    """
+    n = len(points)
+    if n <= 1:
+        return 0
+
+    in_tree = [False] * n
+    min_dist = [float('inf')] * n
+    min_dist[0] = 0
+    total = 0
+
+    for _ in range(n):
+        # Closest point not yet in the tree
+        u = -1
+        for j in range(n):
+            if not in_tree[j] and (u == -1 or min_dist[j] < min_dist[u]):
+                u = j
+        in_tree[u] = True
+        total += min_dist[u]
+
+        ux, uy = points[u]
+        for j in range(n):
+            if not in_tree[j]:
+                d = abs(ux - points[j][0]) + abs(uy - points[j][1])
+                if d < min_dist[j]:
+                    min_dist[j] = d
+
+    return total
+
+
+def manhattan_mst_edges(points):
+    """
+    O(n) candidate edges guaranteed to contain a Manhattan MST.
+    For each point only the nearest neighbor in each of the 8 octants
+    matters. Four coordinate transforms reduce this to one octant
+    (x' >= x, y' - x' >= y - x), answered by a sweep in decreasing x
+    with a Fenwick tree giving min (x' + y') over y' - x' >= y - x.
+    """
+    n = len(points)
+    xs = [p[0] for p in points]
+    ys = [p[1] for p in points]
+    edges = []
+
+    for direction in range(4):
+        if direction == 1 or direction == 3:
+            xs, ys = ys, xs
+        elif direction == 2:
+            xs = [-x for x in xs]
+
+        order = sorted(range(n), key=lambda i: (xs[i], ys[i]))
+        # Compress y - x, reversed so "rank >= r" becomes a prefix
+        keys = sorted(set(ys[i] - xs[i] for i in range(n)))
+        rank = {k: len(keys) - idx for idx, k in enumerate(keys)}
+
+        m = len(keys)
+        tree_val = [float('inf')] * (m + 1)
+        tree_id = [-1] * (m + 1)
+
+        for i in reversed(order):
+            pos = rank[ys[i] - xs[i]]
+
+            # Prefix min over positions 1..pos
+            best, best_id = float('inf'), -1
+            j = pos
+            while j > 0:
+                if tree_val[j] < best:
+                    best, best_id = tree_val[j], tree_id[j]
+                j -= j & -j
+            if best_id != -1:
+                edges.append((i, best_id, best - xs[i] - ys[i]))
+
+            # Insert point i
+            val = xs[i] + ys[i]
+            j = pos
+            while j <= m:
+                if val < tree_val[j]:
+                    tree_val[j], tree_id[j] = val, i
+                j += j & -j
+
+    return edges
+
+
+def min_cost_connect_points_fast(points):
+    """Kruskal's on the O(n) Manhattan candidate edges: O(n log n)."""
+    n = len(points)
+    if n <= 1:
+        return 0
+    return kruskal(n, manhattan_mst_edges(points))
+
+
 # ============================================
 # PATTERN 4: Min Cost to Connect Cities with Threshold
 # ============================================
@@ -156,6 +234,124 @@ def min_cost_to_supply_water(n, wells, pipes):
     return kruskal(n + 1, edges)
 
 
+# ============================================
+# PATTERN 6: Prim's with Decrease-Key
+# ============================================
+def prim_indexed(n, edges, d=2):
+    """
+    Prim's keeping one heap entry per node (IndexedMinHeap,
+    graph_helpers.py): key[v] is the cheapest edge from the tree
+    to v, lowered in place as the tree grows.
+    """
+    if n == 0:
+        return 0
+
+    graph = defaultdict(list)
+    for u, v, w in edges:
+        graph[u].append((w, v))
+        graph[v].append((w, u))
+
+    in_tree = [False] * n
+    heap = IndexedMinHeap(n, d)
+    heap.push(0, 0)
+    mst_weight = 0
+    edges_used = 0
+
+    while heap:
+        u, weight = heap.pop()
+        in_tree[u] = True
+        mst_weight += weight
+        edges_used += 1
+
+        for w, v in graph[u]:
+            if not in_tree[v]:
+                heap.push(v, w)
+
+    return mst_weight if edges_used == n else -1
+
+
+# ============================================
+# PATTERN 7: Boruvka's Algorithm (Parallel Rounds)
+# ============================================
+_worker_edges = None
+
+
+def _init_worker(edges):
+    """Ship the edge list to each worker once, not every round."""
+    global _worker_edges
+    _worker_edges = edges
+
+
+def _cheapest_edges(comp, lo, hi, edges=None):
+    """
+    For edges[lo:hi], cheapest outgoing edge index per component.
+    Ties broken by index so all components agree and no cycle forms.
+    """
+    if edges is None:
+        edges = _worker_edges
+    best = {}
+    for i in range(lo, hi):
+        u, v, w = edges[i]
+        cu, cv = comp[u], comp[v]
+        if cu == cv:
+            continue
+        for c in (cu, cv):
+            if c not in best or (w, i) < (edges[best[c]][2], best[c]):
+                best[c] = i
+    return best
+
+
+def boruvka(n, edges, workers=1):
+    """
+    Find MST weight using Boruvka's.
+    edges = [(u, v, weight), ...]
+
+    Each round every component picks its cheapest outgoing edge and
+    all of them are merged at once; components at least halve, so
+    O(log V) rounds. The edge scan is independent per edge, so it is
+    split into chunks across a process pool.
+    """
+    if n <= 1:
+        return 0
+    if not edges:
+        return -1  # n >= 2 nodes and nothing to connect them
+
+    uf = UnionFind(n)
+    mst_weight = 0
+    m = len(edges)
+    chunk = (m + workers - 1) // workers
+    pool = (ProcessPoolExecutor(workers, initializer=_init_worker,
+                                initargs=(edges,)) if workers > 1 else None)
+
+    try:
+        while uf.count > 1:
+            comp = array('i', uf.find_many(range(n)))
+
+            if pool:
+                futures = [pool.submit(_cheapest_edges, comp, lo, min(lo + chunk, m))
+                           for lo in range(0, m, chunk)]
+                best = {}
+                for future in futures:
+                    for c, i in future.result().items():
+                        if c not in best or (edges[i][2], i) < (edges[best[c]][2], best[c]):
+                            best[c] = i
+            else:
+                best = _cheapest_edges(comp, 0, m, edges)
+
+            if not best:
+                return -1  # Disconnected
+
+            for i in set(best.values()):
+                u, v, w = edges[i]
+                if uf.union(u, v):
+                    mst_weight += w
+    finally:
+        if pool:
+            pool.shutdown()
+
+    return mst_weight
+
+
 # ============================================
 # KEY PROBLEMS (LeetCode)
 # ============================================
@@ -0,0 +1,240 @@
+"""
+ALL-PAIRS SHORTEST PATHS
+========================
+
+WHEN TO USE:
+- Need distance between every pair of nodes
+- Distance matrix / city reachability within threshold
+- Dense graphs: Floyd-Warshall
+- Sparse graphs (maybe negative edges): Johnson's
+
+KEY INSIGHT:
+- Floyd-Warshall: allow intermediate nodes 0..k one at a time.
+  dist[i][j] = min(dist[i][j], dist[i][k] + dist[k][j])
+- Johnson's: reweight edges to be non-negative (Bellman-Ford
+  potentials), then run Dijkstra from every node.
+
+TIME: O(V^3) or O(V * E log V)  |  SPACE: O(V^2)
+"""
+
+import mmap
+import os
+import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+# graph_helpers.py at the repo root, ahead of anything else on sys.path
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if sys.path[:1] != [_ROOT]:
+    sys.path.insert(0, _ROOT)
+from graph_helpers import bellman_ford, dijkstra  # noqa: E402
+
+INF = float('inf')
+
+# ============================================
+# PATTERN 1: Floyd-Warshall
+# ============================================
+def floyd_warshall(n, edges):
+    """
+    Distance matrix from edges = [(u, v, weight), ...].
+    Negative cycle iff some dist[i][i] < 0 afterwards.
+    """
+    dist = [[INF] * n for _ in range(n)]
+    for i in range(n):
+        dist[i][i] = 0
+    for u, v, w in edges:
+        dist[u][v] = min(dist[u][v], w)
+
+    for k in range(n):
+        row_k = dist[k]
+        for i in range(n):
+            d_ik = dist[i][k]
+            if d_ik == INF:
+                continue
+            row_i = dist[i]
+            for j in range(n):
+                if d_ik + row_k[j] < row_i[j]:
+                    row_i[j] = d_ik + row_k[j]
+
+    return dist
+
+
+# ============================================
+# PATTERN 2: Blocked (Tiled) Floyd-Warshall
+# ============================================
+def _min_plus_tile(dist, rows, cols, ks):
+    """dist[i][j] = min(dist[i][j], dist[i][k] + dist[k][j]) on one tile."""
+    for k in ks:
+        row_k = dist[k]
+        for i in rows:
+            d_ik = dist[i][k]
+            if d_ik == INF:
+                continue
+            row_i = dist[i]
+            for j in cols:
+                if d_ik + row_k[j] < row_i[j]:
+                    row_i[j] = d_ik + row_k[j]
+
+
+def floyd_warshall_blocked(dist, block=64):
+    """
+    In-place Floyd-Warshall on an n x n matrix, one block x block tile
+    at a time so the working set stays in cache (or in the pages
+    currently mapped, for a DiskMatrix). For each diagonal tile kb:
+      1. update tile (kb, kb) using itself
+      2. update tiles in row kb and column kb using (kb, kb)
+      3. update every other tile (i, j) using (i, kb) and (kb, j)
+    dist can be a list of lists or DiskMatrix.rows.
+    """
+    n = len(dist)
+    blocks = [range(lo, min(lo + block, n)) for lo in range(0, n, block)]
+
+    for kb in blocks:
+        _min_plus_tile(dist, kb, kb, kb)
+
+        for other in blocks:
+            if other is not kb:
+                _min_plus_tile(dist, kb, other, kb)
+                _min_plus_tile(dist, other, kb, kb)
+
+        for ib in blocks:
+            if ib is kb:
+                continue
+            for jb in blocks:
+                if jb is not kb:
+                    _min_plus_tile(dist, ib, jb, kb)
+
+    return dist
+
+
+# ============================================
+# PATTERN 3: Disk-Backed Distance Matrix
+# ============================================
+class DiskMatrix:
+    """
+    n x n matrix of doubles in a memory-mapped file, for distance
+    matrices larger than RAM. rows[i] is a writable memoryview, so
+    rows[i][j] reads/writes the file directly (the OS pages it in/out).
+    """
+    def __init__(self, path, n, fill=INF):
+        self.n = n
+        with open(path, 'w+b') as f:
+            f.truncate(8 * n * n)
+            self.buffer = mmap.mmap(f.fileno(), 8 * n * n) if n else None
+
+        flat = memoryview(self.buffer).cast('d') if n else []
+        self.rows = [flat[i * n:(i + 1) * n] for i in range(n)]
+
+        # Fill row by row so only one row of filler is in memory
+        filler = array('d', [fill]) * n
+        for row in self.rows:
+            row[:] = filler
+
+    def __getitem__(self, i):
+        return self.rows[i]
+
+    def __len__(self):
+        return self.n
+
+    def close(self):
+        for row in self.rows:
+            row.release()
+        self.rows = []
+        if self.buffer is not None:
+            self.buffer.close()
+
+
+# ============================================
+# PATTERN 4: Johnson's Algorithm
+# ============================================
+_worker_graph = None
+
+
+def _init_worker(graph):
+    """Send the reweighted graph to each worker once."""
+    global _worker_graph
+    _worker_graph = graph
+
+
+def _worker_row(source):
+    return dijkstra(_worker_graph, source, len(_worker_graph))
+
+
+def johnson(n, edges, workers=1, out_path=None):
+    """
+    All-pairs distances for sparse graphs, negative edges allowed.
+    edges = [(u, v, weight), ...]
+
+    1. Bellman-Ford from a virtual node joined to all nodes by
+       0-weight edges gives potentials h.
+    2. w'(u, v) = w + h[u] - h[v] >= 0, so Dijkstra works.
+    3. Run Dijkstra from every node (fanned out over processes),
+       then d(u, v) = d'(u, v) - h[u] + h[v].
+
+    Returns list of rows (or a DiskMatrix if out_path is given),
+    or None if there is a negative cycle.
+    """
+    # Bellman-Ford from the virtual source (graph_helpers.py)
+    h = bellman_ford(n, edges)
+    if h is None:
+        return None
+
+    graph = [[] for _ in range(n)]
+    for u, v, w in edges:
+        graph[u].append((v, w + h[u] - h[v]))
+
+    result = DiskMatrix(out_path, n) if out_path else [None] * n
+
+    def store(u, row):
+        row = [d - h[u] + h[v] if d < INF else INF for v, d in enumerate(row)]
+        if out_path:
+            result[u][:] = array('d', row)
+        else:
+            result[u] = row
+
+    if workers > 1:
+        with ProcessPoolExecutor(workers, initializer=_init_worker,
+                                 initargs=(graph,)) as pool:
+            # Rows arrive in order, so each is written out immediately
+            for u, row in enumerate(pool.map(_worker_row, range(n),
+                                             chunksize=max(1, n // (4 * workers)))):
+                store(u, row)
+    else:
+        for u in range(n):
+            store(u, dijkstra(graph, u, n))
+
+    return result
+
+
+# ============================================
+# PATTERN 5: City With Fewest Reachable Neighbors
+# ============================================
+def find_the_city(n, edges, distance_threshold):
+    """
+    City reaching the fewest others within threshold (largest id on tie).
+    edges[i] = [u, v, w], undirected.
+    """
+    directed = [(u, v, w) for u, v, w in edges] + [(v, u, w) for u, v, w in edges]
+    dist = floyd_warshall(n, directed)
+
+    best_city, best_count = -1, INF
+    for i in range(n):
+        count = sum(1 for j in range(n) if j != i and dist[i][j] <= distance_threshold)
+        if count <= best_count:
+            best_city, best_count = i, count
+
+    return best_city
+
+
+# ============================================
+# KEY PROBLEMS (LeetCode)
+# ============================================
+"""
+Medium:
+- 1334. Find the City With the Smallest Number of Neighbors
+- 399. Evaluate Division
+- 1462. Course Schedule IV (transitive closure)
+
+Hard:
+- 2976. Minimum Cost to Convert String I
+"""
@@ -0,0 +1,192 @@
+"""
+STRONGLY CONNECTED COMPONENTS
+=============================
+
+WHEN TO USE:
+- Directed graph with cycles: group mutually reachable nodes
+- Collapse cycles into single nodes (condensation DAG)
+- Dependency graphs that may contain cycles
+- 2-SAT
+
+KEY INSIGHT: Every directed graph is a DAG of its SCCs.
+Tarjan's: one DFS, low-link finds each SCC root; SCCs finish sinks first.
+Kosaraju's: DFS finish order, then DFS on reversed graph.
+
+TIME: O(V + E)  |  SPACE: O(V + E)
+"""
+
+import os
+import sys
+from array import array
+
+# graph_helpers.py at the repo root, ahead of anything else on sys.path
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if sys.path[:1] != [_ROOT]:
+    sys.path.insert(0, _ROOT)
+from graph_helpers import CSRGraph  # noqa: E402
+
+# ============================================
+# PATTERN 1: Tarjan's Algorithm (Iterative)
+# ============================================
+def tarjan_scc(n, edges):
+    """
+    Return (count, comp) where comp[u] is u's component id.
+    Ids are numbered in topological order of the condensation:
+    every edge u -> v has comp[u] <= comp[v].
+    """
+    csr = CSRGraph.from_edges(n, edges)
+    offsets, targets = csr.offsets, csr.targets
+    index = array('i', [-1]) * n
+    low = array('i', [0]) * n
+    on_stack = bytearray(n)
+    next_slot = offsets[:n]  # Resume point in each node's neighbor list
+    comp = array('i', [-1]) * n
+    scc_stack = []
+    finished = 0
+    time = 0
+
+    for root in range(n):
+        if index[root] != -1:
+            continue
+        index[root] = low[root] = time
+        time += 1
+        scc_stack.append(root)
+        on_stack[root] = 1
+        call_stack = [root]
+
+        while call_stack:
+            u = call_stack[-1]
+            if next_slot[u] < offsets[u + 1]:
+                v = targets[next_slot[u]]
+                next_slot[u] += 1
+                if index[v] == -1:  # "Recurse" into v
+                    index[v] = low[v] = time
+                    time += 1
+                    scc_stack.append(v)
+                    on_stack[v] = 1
+                    call_stack.append(v)
+                elif on_stack[v]:
+                    low[u] = min(low[u], index[v])
+                continue
+
+            # u is done
+            call_stack.pop()
+            if call_stack:
+                p = call_stack[-1]
+                low[p] = min(low[p], low[u])
+
+            if low[u] == index[u]:  # u is the root of an SCC
+                while True:
+                    w = scc_stack.pop()
+                    on_stack[w] = 0
+                    comp[w] = finished
+                    if w == u:
+                        break
+                finished += 1
+
+    # Tarjan finishes sinks first: flip to get topological ids
+    return finished, [finished - 1 - c for c in comp]
+
+
+# ============================================
+# PATTERN 2: Kosaraju's Algorithm (Iterative)
+# ============================================
+def kosaraju_scc(n, edges):
+    """
+    Same output as tarjan_scc().
+    1. DFS on graph, record finish order.
+    2. DFS on reversed graph in reverse finish order: each tree is an SCC.
+    """
+    csr = CSRGraph.from_edges(n, edges)
+    offsets, targets = csr.offsets, csr.targets
+    visited = bytearray(n)
+    next_slot = offsets[:n]
+    order = []
+
+    for root in range(n):
+        if visited[root]:
+            continue
+        visited[root] = 1
+        stack = [root]
+        while stack:
+            u = stack[-1]
+            if next_slot[u] < offsets[u + 1]:
+                v = targets[next_slot[u]]
+                next_slot[u] += 1
+                if not visited[v]:
+                    visited[v] = 1
+                    stack.append(v)
+            else:
+                order.append(stack.pop())
+
+    rev = csr.reverse()
+    r_offsets, r_targets = rev.offsets, rev.targets
+    comp = [-1] * n
+    count = 0
+    for root in reversed(order):
+        if comp[root] != -1:
+            continue
+        comp[root] = count
+        stack = [root]
+        while stack:
+            u = stack.pop()
+            for i in range(r_offsets[u], r_offsets[u + 1]):
+                v = r_targets[i]
+                if comp[v] == -1:
+                    comp[v] = count
+                    stack.append(v)
+        count += 1
+
+    return count, comp
+
+
+# ============================================
+# PATTERN 3: Condensation DAG
+# ============================================
+def condensation(n, edges):
+    """
+    Collapse each SCC into one node.
+    Returns (comp, dag_edges, members):
+    - comp[u]: component of u (ids already in topological order)
+    - dag_edges: deduplicated (cu, cv) edges between components
+    - members[c]: nodes in component c
+    """
+    count, comp = tarjan_scc(n, edges)
+
+    members = [[] for _ in range(count)]
+    for u in range(n):
+        members[comp[u]].append(u)
+
+    dag_edges = sorted({(comp[u], comp[v]) for u, v in edges
+                        if comp[u] != comp[v]})
+    return comp, dag_edges, members
+
+
+# ============================================
+# PATTERN 4: Course Schedule via SCCs
+# ============================================
+def can_finish(num_courses, prerequisites):
+    """
+    Finishable iff no cycle: every SCC is a single node
+    and no course requires itself.
+    """
+    edges = [(b, a) for a, b in prerequisites]
+    if any(a == b for a, b in edges):
+        return False
+    count, _ = tarjan_scc(num_courses, edges)
+    return count == num_courses
+
+
+# ============================================
+# KEY PROBLEMS (LeetCode)
+# ============================================
+"""
+Medium:
+- 207. Course Schedule (cycle = SCC of size > 1)
+- 802. Find Eventual Safe States
+- 1557. Minimum Number of Vertices to Reach All Nodes
+
+Hard:
+- 2360. Longest Cycle in a Graph
+- 2127. Maximum Employees to Be Invited to a Meeting
+"""
@@ -12,8 +12,17 @@ KEY INSIGHT: Use queue. First time you reach a node = shortest path.
 TIME: O(V + E)  |  SPACE: O(V)
 """
 
+import os
+import sys
+from array import array
 from collections import deque
 
+# graph_helpers.py at the repo root, ahead of anything else on sys.path
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if sys.path[:1] != [_ROOT]:
+    sys.path.insert(0, _ROOT)
+from graph_helpers import distance_field  # noqa: E402
+
 # ============================================
 # PATTERN 1: Basic BFS
 # ============================================
@@ -139,6 +148,220 @@ def ladder_length(begin_word, end_word, word_list):
     return 0
 
 
+# ============================================
+# PATTERN 6: Level-Synchronous Distance Field
+# ============================================
+# distance_field(rows, cols, sources, passable) lives in graph_helpers.py:
+# level-by-level multi-source BFS on a wall-padded flat grid, so a
+# neighbor of flat index i is just i - 1, i + 1, i - width, i + width.
+
+
+def multi_source_bfs_levels(grid, sources):
+    """multi_source_bfs() computed with distance_field()."""
+    rows, cols = len(grid), len(grid[0])
+    dist = distance_field(rows, cols, sources)
+    return [[d if d != -1 else float('inf') for d in dist[r * cols:(r + 1) * cols]]
+            for r in range(rows)]
+
+
+def walls_and_gates(rooms):
+    """
+    Fill each empty room (INF) with distance to nearest gate (0).
+    Walls are -1. Same distance field, sources = all gates.
+    """
+    if not rooms:
+        return
+    rows, cols = len(rooms), len(rooms[0])
+    passable = bytearray(cell != -1 for row in rooms for cell in row)
+    gates = [(r, c) for r in range(rows) for c in range(cols) if rooms[r][c] == 0]
+
+    dist = distance_field(rows, cols, gates, passable)
+    for r in range(rows):
+        for c in range(cols):
+            if dist[r * cols + c] > 0:
+                rooms[r][c] = dist[r * cols + c]
+
+
+# ============================================
+# PATTERN 7: Direction-Optimizing BFS
+# ============================================
+def direction_optimizing_bfs(csr, source, reverse_csr=None, alpha=14, beta=24):
+    """
+    BFS that switches between two ways of building the next level:
+    - top-down: each frontier node scans its out-edges (cheap when
+      the frontier is small)
+    - bottom-up: each unvisited node scans its in-edges and stops at
+      the FIRST parent found in the frontier (cheap when the frontier
+      is huge, as in the middle levels of low-diameter graphs)
+    Go bottom-up when frontier edges > unexplored edges / alpha;
+    back to top-down when frontier < n / beta.
+    csr = CSRGraph(n, graph, weighted=False) for an adjacency list;
+    reverse_csr = csr.reverse() (omit for undirected graphs).
+    Visited and frontier sets are bitmaps. Returns (dist, parent),
+    -1 for unreachable.
+    """
+    offsets, targets = csr.offsets, csr.targets
+    reverse_csr = reverse_csr or csr
+    r_offsets, r_targets = reverse_csr.offsets, reverse_csr.targets
+    n = csr.n
+
+    visited = bytearray((n + 7) >> 3)
+    dist = array('i', [-1]) * n
+    parent = array('i', [-1]) * n
+    visited[source >> 3] |= 1 << (source & 7)
+    dist[source] = 0
+
+    frontier = [source]
+    unexplored_edges = len(targets) - (offsets[source + 1] - offsets[source])
+    bottom_up = False
+    level = 0
+
+    while frontier:
+        level += 1
+        frontier_edges = sum(offsets[u + 1] - offsets[u] for u in frontier)
+        if not bottom_up and frontier_edges > unexplored_edges / alpha:
+            bottom_up = True
+        elif bottom_up and len(frontier) < n / beta:
+            bottom_up = False
+
+        next_frontier = []
+        if bottom_up:
+            in_frontier = bytearray((n + 7) >> 3)
+            for u in frontier:
+                in_frontier[u >> 3] |= 1 << (u & 7)
+            for v in range(n):
+                if visited[v >> 3] >> (v & 7) & 1:
+                    continue
+                for i in range(r_offsets[v], r_offsets[v + 1]):
+                    u = r_targets[i]
+                    if in_frontier[u >> 3] >> (u & 7) & 1:
+                        visited[v >> 3] |= 1 << (v & 7)
+                        dist[v] = level
+                        parent[v] = u
+                        next_frontier.append(v)
+                        break
+        else:
+            for u in frontier:
+                for i in range(offsets[u], offsets[u + 1]):
+                    v = targets[i]
+                    if not visited[v >> 3] >> (v & 7) & 1:
+                        visited[v >> 3] |= 1 << (v & 7)
+                        dist[v] = level
+                        parent[v] = u
+                        next_frontier.append(v)
+
+        for v in next_frontier:
+            unexplored_edges -= offsets[v + 1] - offsets[v]
+        frontier = next_frontier
+
+    return dist, parent
+
+
+# ============================================
+# PATTERN 8: Word Ladder with a Wildcard Index
+# ============================================
+class WordLadderIndex:
+    """
+    Preindex the dictionary once by wildcard pattern: "hot" is filed
+    under "*ot", "h*t", "ho*". Neighbors of a word = words sharing one
+    of its L patterns, so no 26 * L candidate strings per word.
+    The index is reused across many (begin, end) queries.
+    """
+    def __init__(self, word_list):
+        self.words = set(word_list)
+        self.patterns = {}
+        for word in self.words:
+            for pattern in self._patterns(word):
+                self.patterns.setdefault(pattern, []).append(word)
+
+    @staticmethod
+    def _patterns(word):
+        return [word[:i] + '*' + word[i + 1:] for i in range(len(word))]
+
+    def neighbors(self, word):
+        for pattern in self._patterns(word):
+            for other in self.patterns.get(pattern, ()):
+                if other != word:
+                    yield other
+
+    def ladder_length(self, begin_word, end_word):
+        """
+        Same answer as ladder_length(), except begin_word == end_word
+        gives 1 (a one-word ladder) where ladder_length() gives 2.
+        Bidirectional BFS: always grow the smaller frontier; done when
+        it touches the other one.
+        """
+        if end_word not in self.words:
+            return 0
+        if begin_word == end_word:
+            return 1
+
+        front, back = {begin_word}, {end_word}
+        visited = {begin_word, end_word}
+        steps = 1
+
+        while front and back:
+            if len(front) > len(back):
+                front, back = back, front
+
+            next_front = set()
+            for word in front:
+                for neighbor in self.neighbors(word):
+                    if neighbor in back:
+                        return steps + 1
+                    if neighbor not in visited:
+                        visited.add(neighbor)
+                        next_front.add(neighbor)
+            front = next_front
+            steps += 1
+
+        return 0
+
+    def all_ladders(self, begin_word, end_word):
+        """
+        Every shortest transformation sequence (Word Ladder II).
+        Level-by-level BFS recording all parents on shortest paths,
+        stopping at the level that reaches end_word, then walk back.
+        begin_word == end_word gives [[begin_word]].
+        """
+        if end_word not in self.words:
+            return []
+        if begin_word == end_word:
+            return [[begin_word]]
+
+        parents = {begin_word: []}
+        level = {begin_word}
+        found = False
+
+        while level and not found:
+            next_level = {}
+            for word in level:
+                for neighbor in self.neighbors(word):
+                    if neighbor in parents:
+                        continue  # Reached on an earlier level
+                    next_level.setdefault(neighbor, []).append(word)
+                    if neighbor == end_word:
+                        found = True
+            parents.update(next_level)
+            level = set(next_level)
+
+        if not found:
+            return []
+
+        # Walk parent links back from end_word (explicit stack)
+        ladders = []
+        stack = [[end_word]]
+        while stack:
+            path = stack.pop()
+            if path[-1] == begin_word:
+                ladders.append(path[::-1])
+                continue
+            for parent in parents[path[-1]]:
+                stack.append(path + [parent])
+
+        return ladders
+
+
 # ============================================
 # KEY PROBLEMS (LeetCode)
 # ============================================
@@ -14,7 +14,18 @@ KEY INSIGHT: Treat each cell as a node, adjacent cells as edges.
 TIME: O(m*n)  |  SPACE: O(m*n)
 """
 
+import mmap
+import os
+import sys
+from array import array
 from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+# graph_helpers.py at the repo root, ahead of anything else on sys.path
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if sys.path[:1] != [_ROOT]:
+    sys.path.insert(0, _ROOT)
+from graph_helpers import distance_field  # noqa: E402
 
 # ============================================
 # PATTERN 1: Number of Islands (DFS)
@@ -164,6 +175,324 @@ def oranges_rotting(grid):
     return max_time if fresh == 0 else -1
 
 
+# ============================================
+# PATTERN 6: Run-Based Component Labeling (No Recursion)
+# ============================================
+def _row_runs(row):
+    """[(start, end), ...] of consecutive nonzero bytes in row."""
+    runs = []
+    start = row.find(1)
+    while start != -1:
+        end = row.find(0, start)
+        if end == -1:
+            end = len(row)
+        runs.append((start, end))
+        start = row.find(1, end)
+    return runs
+
+
+def to_mask(grid, land=1):
+    """Rows of any cell type -> bytearray rows of 0/1."""
+    return [bytearray(1 if cell == land else 0 for cell in row) for row in grid]
+
+
+def label_components(mask):
+    """
+    4-connected labeling of bytearray rows (1 = land) in two passes:
+      1. split each row into runs of 1s; union each run with the runs
+         it overlaps in the previous row (union-find over runs)
+      2. resolve runs to final labels and fill rows by slice
+    Work is per run, not per cell, and nothing recurses.
+    Returns (labels, count, areas): labels[r][c] = component id
+    (-1 for water), areas[id] = number of cells.
+    """
+    parent = array('i')
+
+    def find(x):
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    all_runs = []  # Per row: [(start, end, run_id), ...]
+    prev = []
+    for row in mask:
+        runs = []
+        j = 0
+        for start, end in _row_runs(row):
+            run_id = len(parent)
+            parent.append(run_id)
+            # Skip previous-row runs that end before this one starts
+            while j < len(prev) and prev[j][1] <= start:
+                j += 1
+            k = j
+            while k < len(prev) and prev[k][0] < end:
+                a, b = find(prev[k][2]), find(run_id)
+                if a != b:
+                    parent[max(a, b)] = min(a, b)
+                k += 1
+            runs.append((start, end, run_id))
+        all_runs.append(runs)
+        prev = runs
+
+    # Pass 2: compact labels, areas, fill label rows
+    final = {}
+    areas = []
+    labels = []
+    for row, runs in zip(mask, all_runs):
+        out = array('i', [-1]) * len(row)
+        for start, end, run_id in runs:
+            root = find(run_id)
+            if root not in final:
+                final[root] = len(areas)
+                areas.append(0)
+            label = final[root]
+            out[start:end] = array('i', [label]) * (end - start)
+            areas[label] += end - start
+        labels.append(out)
+
+    return labels, len(areas), areas
+
+
+def num_islands_runs(grid):
+    """num_islands() without recursion or mutating grid."""
+    if not grid:
+        return 0
+    return label_components(to_mask(grid, '1'))[1]
+
+
+def max_area_of_island_runs(grid):
+    """max_area_of_island() without recursion or mutating grid."""
+    _, _, areas = label_components(to_mask(grid, 1))
+    return max(areas, default=0)
+
+
+# ============================================
+# PATTERN 7: Tiled Labeling of Rasters on Disk
+# ============================================
+def _read_tile(mm, cols, r0, c0, h, w, land):
+    """Tile rows as 0/1 bytes (only this tile is read from the file)."""
+    table = bytes(1 if b == land else 0 for b in range(256))
+    return [mm[(r0 + r) * cols + c0:(r0 + r) * cols + c0 + w].translate(table)
+            for r in range(h)]
+
+
+def _border_ids(labels):
+    """Compact id for each local label on the tile's outer ring."""
+    ids = {}
+    for side in (labels[0], labels[-1], (row[0] for row in labels),
+                 (row[-1] for row in labels)):
+        for x in side:
+            if x != -1 and x not in ids:
+                ids[x] = len(ids)
+    return ids
+
+
+def _tile_summary(path, rows, cols, r0, c0, h, w, land):
+    """
+    Label one tile; keep only what stitching needs. Components on the
+    tile border get compact border ids; interior-only components can
+    never be stitched, so they shrink to a count and a max area.
+    """
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        labels, count, areas = label_components(
+            _read_tile(mm, cols, r0, c0, h, w, land))
+
+    ids = _border_ids(labels)
+    border_areas = array('q', [0]) * len(ids)
+    interior_count = interior_max = 0
+    for label in range(count):
+        if label in ids:
+            border_areas[ids[label]] = areas[label]
+        else:
+            interior_count += 1
+            interior_max = max(interior_max, areas[label])
+
+    def remap(side):
+        return array('i', (ids[x] if x != -1 else -1 for x in side))
+
+    top, bottom = remap(labels[0]), remap(labels[-1])
+    left = remap(row[0] for row in labels)
+    right = remap(row[-1] for row in labels)
+    # Components touching the outer edge of the whole raster
+    on_edge = set()
+    for side, at_edge in ((top, r0 == 0), (bottom, r0 + h == rows),
+                          (left, c0 == 0), (right, c0 + w == cols)):
+        if at_edge:
+            on_edge.update(x for x in side if x != -1)
+
+    return (border_areas, top, bottom, left, right, on_edge,
+            interior_count, interior_max)
+
+
+def _tile_grid(rows, cols, tile):
+    th, tw = tile
+    return [(r0, c0, min(th, rows - r0), min(tw, cols - c0))
+            for r0 in range(0, rows, th) for c0 in range(0, cols, tw)]
+
+
+def tiled_components(path, rows, cols, land=1, tile=(1024, 1024), workers=1):
+    """
+    Components of a rows x cols raster stored as raw bytes (row-major)
+    in path, one byte per cell, land cells == land.
+    Each tile is labeled on its own (in parallel if workers > 1), then
+    labels on both sides of every tile border are unioned. Memory is
+    one tile plus the tile borders, never the whole raster, and the
+    union-find only holds components touching a tile border.
+    Returns (areas, safe, tiles, find, interior):
+    - areas: area of each border-touching component, keyed by root
+    - safe: the roots touching the raster edge
+    - tiles: per-tile ((r0, c0, h, w), base, border_count);
+      find(base + border id) (see _border_ids) gives that component's
+      root, for border ids 0..border_count-1
+    - interior: (count, max_area) of components inside a single tile
+    """
+    specs = _tile_grid(rows, cols, tile)
+    args = [(path, rows, cols, r0, c0, h, w, land) for r0, c0, h, w in specs]
+    if workers > 1:
+        with ProcessPoolExecutor(workers) as pool:
+            summaries = list(pool.map(_tile_summary, *zip(*args)))
+    else:
+        summaries = [_tile_summary(*a) for a in args]
+
+    # Global id = tile base + border id
+    bases = []
+    total = 0
+    for summary in summaries:
+        bases.append(total)
+        total += len(summary[0])
+
+    parent = list(range(total))
+
+    def find(x):
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def stitch(side_a, base_a, side_b, base_b):
+        for a, b in zip(side_a, side_b):
+            if a != -1 and b != -1:
+                ra, rb = find(base_a + a), find(base_b + b)
+                if ra != rb:
+                    parent[max(ra, rb)] = min(ra, rb)
+
+    tiles_per_row = (cols + tile[1] - 1) // tile[1]
+    for t, summary in enumerate(summaries):
+        _, top, _, left, _, _, _, _ = summary
+        if t % tiles_per_row:  # Tile to the left
+            stitch(summaries[t - 1][4], bases[t - 1], left, bases[t])
+        if t >= tiles_per_row:  # Tile above
+            stitch(summaries[t - tiles_per_row][2], bases[t - tiles_per_row],
+                   top, bases[t])
+
+    areas = {}
+    safe = set()
+    interior_count = interior_max = 0
+    for t, summary in enumerate(summaries):
+        border_areas, *_, on_edge, count, max_area = summary
+        for b, area in enumerate(border_areas):
+            root = find(bases[t] + b)
+            areas[root] = areas.get(root, 0) + area
+        safe.update(find(bases[t] + b) for b in on_edge)
+        interior_count += count
+        interior_max = max(interior_max, max_area)
+
+    counts = [len(summary[0]) for summary in summaries]
+    return (areas, safe, list(zip(specs, bases, counts)), find,
+            (interior_count, interior_max))
+
+
+def num_islands_tiled(path, rows, cols, land=ord('1'), **kwargs):
+    """num_islands() for a raster file too big for memory."""
+    areas, _, _, _, interior = tiled_components(path, rows, cols, land,
+                                                **kwargs)
+    return len(areas) + interior[0]
+
+
+def max_area_of_island_tiled(path, rows, cols, land=1, **kwargs):
+    """max_area_of_island() for a raster file too big for memory."""
+    areas, _, _, _, interior = tiled_components(path, rows, cols, land,
+                                                **kwargs)
+    return max(max(areas.values(), default=0), interior[1])
+
+
+def _capture_tile(path, cols, r0, c0, h, w, region, fill, safe_ids):
+    """
+    Pass 2 of solve_tiled() for one tile: relabel it and overwrite the
+    runs of captured components with fill. safe_ids = border ids (see
+    _border_ids) whose component reaches the raster edge. Each changed
+    row is written back as one slice.
+    """
+    with open(path, 'r+b') as f, mmap.mmap(f.fileno(), 0) as mm:
+        mask = _read_tile(mm, cols, r0, c0, h, w, region)
+        labels, count, _ = label_components(mask)
+        captured = bytearray([1]) * count
+        for label, b in _border_ids(labels).items():
+            if b in safe_ids:
+                captured[label] = 0
+
+        for r, (bits, row_labels) in enumerate(zip(mask, labels)):
+            runs = [(start, end) for start, end in _row_runs(bits)
+                    if captured[row_labels[start]]]
+            if not runs:
+                continue
+            offset = (r0 + r) * cols + c0
+            row = bytearray(mm[offset:offset + w])
+            for start, end in runs:
+                row[start:end] = bytes([fill]) * (end - start)
+            mm[offset:offset + w] = row
+        mm.flush()
+
+
+def solve_tiled(path, rows, cols, region=ord('O'), fill=ord('X'),
+                tile=(1024, 1024), workers=1):
+    """
+    solve() on a raster file: region cells not connected to the
+    border become fill. Pass 1 finds components touching the edge;
+    pass 2 relabels each tile (in parallel if workers > 1; tiles never
+    overlap) and overwrites captured cells in place.
+    Interior-only components never reach the edge, so are captured.
+    """
+    _, safe, tiles, find, _ = tiled_components(path, rows, cols, region,
+                                               tile, workers)
+
+    args = [(path, cols, r0, c0, h, w, region, fill,
+             {b for b in range(count) if find(base + b) in safe})
+            for (r0, c0, h, w), base, count in tiles]
+    if workers > 1:
+        with ProcessPoolExecutor(workers) as pool:
+            list(pool.map(_capture_tile, *zip(*args)))
+    else:
+        for a in args:
+            _capture_tile(*a)
+
+
+# ============================================
+# PATTERN 8: Rotting Oranges as a Distance Field
+# ============================================
+def oranges_rotting_levels(grid):
+    """
+    oranges_rotting() via distance_field() from graph_helpers.py:
+    dist[i] = minute cell i rots. Answer = latest fresh orange,
+    -1 if one is never reached.
+    Does not modify grid.
+    """
+    rows, cols = len(grid), len(grid[0])
+    flat = [cell for row in grid for cell in row]
+    passable = bytearray(cell != 0 for cell in flat)
+    rotten = [(r, c) for r in range(rows) for c in range(cols) if grid[r][c] == 2]
+
+    dist = distance_field(rows, cols, rotten, passable)
+    minutes = 0
+    for cell, d in zip(flat, dist):
+        if cell == 1:
+            if d == -1:
+                return -1
+            minutes = max(minutes, d)
+    return minutes
+
+
 # ============================================
 # KEY PROBLEMS (LeetCode)
 # ============================================
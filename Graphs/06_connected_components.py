@@ -13,8 +13,17 @@ Each run discovers one component.
 TIME: O(V + E)  |  SPACE: O(V)
 """
 
+import os
+import sys
+from array import array
 from collections import defaultdict, deque
 
+# graph_helpers.py at the repo root, ahead of anything else on sys.path
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if sys.path[:1] != [_ROOT]:
+    sys.path.insert(0, _ROOT)
+from graph_helpers import CSRGraph  # noqa: E402
+
 # ============================================
 # PATTERN 1: Count Components (DFS)
 # ============================================
@@ -176,6 +185,111 @@ def critical_connections(n, connections):
     return bridges
 
 
+# ============================================
+# PATTERN 6: Bridges, Articulation Points, Biconnected Components
+# ============================================
+def biconnectivity(n, edges):
+    """
+    Tarjan's low-link with an explicit stack (no recursion limit).
+    Returns (bridges, articulation_points, two_edge_label, blocks):
+    - bridges: edge ids whose removal disconnects the graph
+    - articulation_points: nodes whose removal disconnects the graph
+    - two_edge_label[u]: 2-edge-connected component of u
+    - blocks: biconnected components, each a list of edge ids
+    """
+    # edge_ids tells parallel edges apart from the tree edge we arrived by
+    csr = CSRGraph.from_edges(n, edges, directed=False)
+    offsets, targets, edge_ids = csr.offsets, csr.targets, csr.edge_ids
+    disc = array('i', [-1]) * n
+    low = array('i', [0]) * n
+    parent_edge = array('i', [-1]) * n
+    next_slot = offsets[:n]  # Resume point in each node's neighbor list
+    is_bridge = bytearray(len(edges))
+    is_cut = bytearray(n)
+    blocks = []
+    edge_stack = []
+    time = 0
+
+    for root in range(n):
+        if disc[root] != -1:
+            continue
+        disc[root] = low[root] = time
+        time += 1
+        root_children = 0
+        stack = [root]
+
+        while stack:
+            u = stack[-1]
+            if next_slot[u] < offsets[u + 1]:
+                i = next_slot[u]
+                next_slot[u] += 1
+                v, e = targets[i], edge_ids[i]
+                if e == parent_edge[u]:
+                    continue
+                if disc[v] == -1:  # Tree edge: "recurse"
+                    parent_edge[v] = e
+                    disc[v] = low[v] = time
+                    time += 1
+                    edge_stack.append(e)
+                    stack.append(v)
+                    if u == root:
+                        root_children += 1
+                elif disc[v] < disc[u]:  # Back edge to an ancestor
+                    low[u] = min(low[u], disc[v])
+                    edge_stack.append(e)
+                continue
+
+            # All neighbors done: "return" to parent
+            stack.pop()
+            if not stack:
+                break
+            p = stack[-1]
+            low[p] = min(low[p], low[u])
+            if low[u] > disc[p]:
+                is_bridge[parent_edge[u]] = 1
+            if low[u] >= disc[p]:
+                # p separates u's subtree: pop one biconnected block
+                if p != root:
+                    is_cut[p] = 1
+                block = []
+                while True:
+                    e = edge_stack.pop()
+                    block.append(e)
+                    if e == parent_edge[u]:
+                        break
+                blocks.append(block)
+
+        if root_children > 1:
+            is_cut[root] = 1
+
+    # 2-edge-connected components: flood fill without crossing bridges
+    label = array('i', [-1]) * n
+    count = 0
+    for start in range(n):
+        if label[start] != -1:
+            continue
+        label[start] = count
+        stack = [start]
+        while stack:
+            u = stack.pop()
+            for i in range(offsets[u], offsets[u + 1]):
+                v = targets[i]
+                if label[v] == -1 and not is_bridge[edge_ids[i]]:
+                    label[v] = count
+                    stack.append(v)
+        count += 1
+
+    bridges = [e for e in range(len(edges)) if is_bridge[e]]
+    articulation_points = [u for u in range(n) if is_cut[u]]
+    return bridges, articulation_points, list(label), blocks
+
+
+def critical_connections_iterative(n, connections):
+    """critical_connections() without recursion, any number of components."""
+    bridges, _, _, _ = biconnectivity(n, connections)
+    return [list(connections[e]) for e in bridges]
+
+
 # ============================================
 # KEY PROBLEMS (LeetCode)
 # ============================================
@@ -13,9 +13,18 @@ Track visited to avoid revisiting.
 TIME: O(V + E)  |  SPACE: O(V)
 """
 
+import os
+import sys
+from array import array
 from collections import defaultdict, deque
 import heapq
 
+# graph_helpers.py at the repo root, ahead of anything else on sys.path
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if sys.path[:1] != [_ROOT]:
+    sys.path.insert(0, _ROOT)
+from graph_helpers import semiring_path  # noqa: E402
+
 # ============================================
 # PATTERN 1: Valid Path in Graph
 # ============================================
@@ -79,38 +88,104 @@ def minimum_effort_path(heights):
     return 0
 
 
+class EffortIndex:
+    """
+    Many minimum-effort queries on one height grid.
+
+    Kruskal reconstruction tree: add grid edges by increasing effort;
+    each union creates a new node, parent of both components, labeled
+    with that effort. The minimax effort between two cells is the
+    label of their lowest common ancestor (binary lifting).
+    Build O(E log E), query O(log n).
+    """
+    def __init__(self, heights):
+        rows, cols = len(heights), len(heights[0])
+        self.cols = cols
+        cells = rows * cols
+
+        edges = []
+        for r in range(rows):
+            for c in range(cols):
+                if c + 1 < cols:
+                    edges.append((abs(heights[r][c] - heights[r][c + 1]),
+                                  r * cols + c, r * cols + c + 1))
+                if r + 1 < rows:
+                    edges.append((abs(heights[r][c] - heights[r + 1][c]),
+                                  r * cols + c, (r + 1) * cols + c))
+        edges.sort()
+
+        # Tree nodes: cells are 0..cells-1, merges get cells, cells+1, ...
+        size = 2 * cells - 1
+        parent = array('i', range(size))
+        self.value = array('q', [0]) * size
+        uf = array('i', range(size))  # Component -> its tree node
+
+        def find(x):
+            while uf[x] != x:
+                uf[x] = uf[uf[x]]
+                x = uf[x]
+            return x
+
+        node = cells
+        for effort, a, b in edges:
+            ra, rb = find(a), find(b)
+            if ra == rb:
+                continue
+            parent[ra] = parent[rb] = node
+            uf[ra] = uf[rb] = node
+            self.value[node] = effort
+            node += 1
+
+        # Parents always have larger ids, so one reverse pass sets depth
+        depth = array('i', [0]) * size
+        for x in range(size - 2, -1, -1):
+            depth[x] = depth[parent[x]] + 1
+        self.depth = depth
+
+        # up[j][x] = 2**j-th ancestor; no jump exceeds the tree depth
+        self.up = [parent]
+        for _ in range(max(depth).bit_length() - 1):
+            prev = self.up[-1]
+            self.up.append(array('i', (prev[prev[x]] for x in range(size))))
+
+    def lca(self, a, b):
+        depth, up = self.depth, self.up
+        if depth[a] < depth[b]:
+            a, b = b, a
+        diff = depth[a] - depth[b]
+        j = 0
+        while diff:
+            if diff & 1:
+                a = up[j][a]
+            diff >>= 1
+            j += 1
+        if a == b:
+            return a
+        for j in range(len(up) - 1, -1, -1):
+            if up[j][a] != up[j][b]:
+                a, b = up[j][a], up[j][b]
+        return up[0][a]
+
+    def query(self, source, target):
+        """Minimum effort between cells (r1, c1) and (r2, c2)."""
+        a = source[0] * self.cols + source[1]
+        b = target[0] * self.cols + target[1]
+        if a == b:
+            return 0
+        return self.value[self.lca(a, b)]
+
+
 # ============================================
 # PATTERN 3: Path with Maximum Probability
 # ============================================
 def max_probability(n, edges, probs, start, end):
-    """Find path with maximum success probability."""
-    graph = defaultdict(list)
-    for (u, v), prob in zip(edges, probs):
-        graph[u].append((v, prob))
-        graph[v].append((u, prob))
-
-    # Max-heap (negate prob for max behavior)
-    max_prob = [0.0] * n
-    max_prob[start] = 1.0
-    heap = [(-1.0, start)]
-
-    while heap:
-        neg_prob, node = heapq.heappop(heap)
-        prob = -neg_prob
-
-        if node == end:
-            return prob
-
-        if prob < max_prob[node]:
-            continue
-
-        for neighbor, edge_prob in graph[node]:
-            new_prob = prob * edge_prob
-            if new_prob > max_prob[neighbor]:
-                max_prob[neighbor] = new_prob
-                heapq.heappush(heap, (-new_prob, neighbor))
-
-    return 0.0
+    """
+    Find path with maximum success probability.
+    Max-times semiring in log space (semiring_path, graph_helpers.py),
+    so path comparisons don't underflow on long paths.
+    """
+    return semiring_path(n, [(u, v, p) for (u, v), p in zip(edges, probs)],
+                         start, end, 'max_times')
 
 
 # ============================================
@@ -160,4 +235,7 @@ Medium:
 - 1514. Path with Maximum Probability
 - 1129. Shortest Path with Alternating Colors
 - 1334. Find the City With Smallest Number of Neighbors
+
+Hard:
+- 1697. Checking Existence of Edge Length Limited Paths
 """
@@ -0,0 +1,79 @@
+"""
+Node expansions of A* (AdvGraphs/03_dijkstras_algorithm.py) against
+the BFS/Dijkstra baselines.
+
+    python benchmarks/astar_expansions.py [side] [queries]
+
+1. Obstacle elimination on a side x side grid (30% walls, k = side/4):
+   shortest_path() vs shortest_path_astar() (Manhattan + dominance).
+   The baseline's heap pops are counted by swapping in a counting heap.
+2. Random s-t queries on a grid road network: astar() with h = 0
+   (plain Dijkstra) vs the ALT landmark heuristic.
+"""
+
+import heapq
+import random
+import types
+
+from bench_utils import arg, load, timed
+from contraction_hierarchy import grid_graph
+
+dij = load('AdvGraphs/03_dijkstras_algorithm.py', 'dijkstras')
+
+
+def count_pops(fn, *args):
+    """(result, heap pops) for a function using the module's heapq."""
+    pops = [0]
+
+    def heappop(heap):
+        pops[0] += 1
+        return heapq.heappop(heap)
+
+    dij.heapq = types.SimpleNamespace(heappop=heappop, heappush=heapq.heappush)
+    try:
+        return fn(*args), pops[0]
+    finally:
+        dij.heapq = heapq
+
+
+def main():
+    side, queries = arg(1, 60), arg(2, 50)
+    rng = random.Random(0)
+
+    print(f"obstacle elimination, {side}x{side} grid, k={side // 4}")
+    total = {'bfs': [0, 0.0], 'astar': [0, 0.0]}
+    for _ in range(5):
+        grid = [[int(rng.random() < 0.3) for _ in range(side)] for _ in range(side)]
+        grid[0][0] = grid[-1][-1] = 0
+        (expected, pops), t_bfs = timed(count_pops, dij.shortest_path, grid, side // 4)
+        stats = {}
+        got, t_astar = timed(dij.shortest_path_astar, grid, side // 4, stats)
+        assert got == expected
+        total['bfs'][0] += pops
+        total['bfs'][1] += t_bfs
+        total['astar'][0] += stats['expanded']
+        total['astar'][1] += t_astar
+    for name, (expanded, seconds) in total.items():
+        print(f"  {name:<8} {expanded / 5:10.0f} expansions  {seconds / 5:6.3f}s per grid")
+
+    n, graph = grid_graph(side)
+    landmarks, t_build = timed(dij.Landmarks, graph, n, 8)
+    print(f"road grid n={n}, {queries} queries, 8 landmarks ({t_build:.2f}s to build)")
+    total = {'dijkstra': [0, 0.0], 'ALT': [0, 0.0]}
+    for _ in range(queries):
+        s, t = rng.randrange(n), rng.randrange(n)
+        base, alt = {}, {}
+        expected, t_base = timed(dij.astar, graph, s, t, n, lambda u: 0, base)
+        got, t_alt = timed(dij.astar, graph, s, t, n, landmarks.heuristic(t), alt)
+        assert got == expected
+        total['dijkstra'][0] += base['expanded']
+        total['dijkstra'][1] += t_base
+        total['ALT'][0] += alt['expanded']
+        total['ALT'][1] += t_alt
+    for name, (expanded, seconds) in total.items():
+        print(f"  {name:<8} {expanded / queries:10.0f} expansions  "
+              f"{seconds / queries * 1e3:6.2f} ms per query")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""
+Shared helpers for the scripts in benchmarks/.
+
+Pattern files have numeric names (03_dijkstras_algorithm.py), so they
+are loaded by path instead of imported.
+"""
+
+import importlib.util
+import os
+import random
+import resource
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if sys.path[:1] != [ROOT]:
+    sys.path.insert(0, ROOT)  # For graph_helpers
+
+
+def load(relpath, name):
+    """Load ROOT/relpath as module `name` (registered for pickling)."""
+    spec = importlib.util.spec_from_file_location(
+        name, os.path.join(ROOT, relpath))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module  # So worker processes can unpickle it
+    spec.loader.exec_module(module)
+    return module
+
+
+def arg(i, default, kind=int):
+    """sys.argv[i] converted with kind, or default."""
+    return kind(sys.argv[i]) if len(sys.argv) > i else default
+
+
+def timed(fn, *args, **kwargs):
+    """(result, seconds) for one call."""
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process so far (Linux: KiB)."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def current_rss_mb():
+    with open('/proc/self/statm') as f:
+        return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 2**20
+
+
+def random_edges(n, m, max_weight=1000, seed=0, connected=True):
+    """m directed (u, v, w) edges; a random spanning tree comes first."""
+    rng = random.Random(seed)
+    edges = []
+    if connected:
+        edges = [(rng.randrange(v), v, rng.randint(1, max_weight))
+                 for v in range(1, n)]
+    edges += [(rng.randrange(n), rng.randrange(n), rng.randint(1, max_weight))
+              for _ in range(m - len(edges))]
+    return edges
+
+
+def adjacency(n, edges, undirected=False):
+    """graph[u] = [(v, w), ...] from (u, v, w) edges."""
+    graph = [[] for _ in range(n)]
+    for u, v, w in edges:
+        graph[u].append((v, w))
+        if undirected:
+            graph[v].append((u, w))
+    return graph
@@ -0,0 +1,57 @@
+"""
+Boruvka MST worker scaling (AdvGraphs/04_kruskal_prims.py).
+
+    python benchmarks/boruvka_scaling.py [n] [m] [max_workers]
+
+Times boruvka() on one random connected graph with 1, 2, 4, 8 workers
+(up to max_workers) and checks every result against kruskal().
+"""
+
+import importlib.util
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+spec = importlib.util.spec_from_file_location(
+    'kruskal_prims', os.path.join(ROOT, 'AdvGraphs', '04_kruskal_prims.py'))
+mst = importlib.util.module_from_spec(spec)
+sys.modules['kruskal_prims'] = mst  # So worker processes can unpickle it
+spec.loader.exec_module(mst)
+
+
+def random_connected_graph(n, m, seed=0):
+    rng = random.Random(seed)
+    # Random spanning tree first so the graph is connected
+    edges = [(rng.randrange(v), v, rng.randint(1, 10**6)) for v in range(1, n)]
+    edges += [(rng.randrange(n), rng.randrange(n), rng.randint(1, 10**6))
+              for _ in range(m - len(edges))]
+    return edges
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    m = int(sys.argv[2]) if len(sys.argv) > 2 else 1_000_000
+    max_workers = int(sys.argv[3]) if len(sys.argv) > 3 else 8
+    edges = random_connected_graph(n, m)
+
+    start = time.perf_counter()
+    expected = mst.kruskal(n, list(edges))
+    print(f"n={n} m={m} cpus={os.cpu_count()}")
+    print(f"kruskal          {time.perf_counter() - start:8.2f}s")
+
+    baseline = None
+    workers = 1
+    while workers <= max_workers:
+        start = time.perf_counter()
+        weight = mst.boruvka(n, edges, workers)
+        elapsed = time.perf_counter() - start
+        assert weight == expected, (weight, expected)
+        baseline = baseline or elapsed
+        print(f"boruvka x{workers:<2}     {elapsed:8.2f}s  speedup {baseline / elapsed:5.2f}")
+        workers *= 2
+
+
+if __name__ == '__main__':
+    main()
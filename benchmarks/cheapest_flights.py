@@ -0,0 +1,38 @@
+"""
+find_cheapest_price() backends (AdvGraphs/03_dijkstras_algorithm.py)
+as the stop limit k grows: the (price, city, stops) heap search vs the
+k-round Bellman-Ford relaxation.
+
+    python benchmarks/cheapest_flights.py [cities] [flights] [queries]
+
+Both backends must agree on every query.
+"""
+
+import random
+
+from bench_utils import arg, load, random_edges, timed
+
+dij = load('AdvGraphs/03_dijkstras_algorithm.py', 'dijkstras')
+
+
+def main():
+    n, m, queries = arg(1, 2_000), arg(2, 20_000), arg(3, 20)
+    flights = random_edges(n, m, max_weight=500)
+    rng = random.Random(1)
+    pairs = [(rng.randrange(n), rng.randrange(n)) for _ in range(queries)]
+    print(f"cities={n} flights={m}, {queries} queries, ms per query")
+    print(f"{'k':>4} {'heap':>9} {'bellman_ford':>13}")
+
+    for k in (0, 1, 2, 5, 10, 20, 50, 100):
+        answers, line = [], f"{k:>4}"
+        for backend, width in (('heap', 9), ('bellman_ford', 13)):
+            result, seconds = timed(lambda: [dij.find_cheapest_price(n, flights, s, t, k, backend)
+                                             for s, t in pairs])
+            answers.append(result)
+            line += f" {seconds / queries * 1e3:>{width}.2f}"
+        assert answers[0] == answers[1], k
+        print(line)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+"""
+min_cost_connect_points() variants (AdvGraphs/04_kruskal_prims.py).
+
+    python benchmarks/connect_points.py [sizes...]
+
+all-pairs Kruskal (the original), dense O(n^2) Prim and the Manhattan
+MST candidate-edge version on random points. The quadratic ones are
+skipped above a size limit (they would run for hours); every result
+computed is checked against the others.
+"""
+
+import random
+import sys
+
+from bench_utils import load, timed
+
+mst = load('AdvGraphs/04_kruskal_prims.py', 'kruskal_prims')
+
+LIMITS = {'all-pairs': 2000, 'dense': 5000, 'fast': float('inf')}
+
+
+def main():
+    sizes = [int(x) for x in sys.argv[1:]] or [1000, 100_000, 1_000_000]
+    runs = (('all-pairs', mst.min_cost_connect_points),
+            ('dense', mst.min_cost_connect_points_dense),
+            ('fast', mst.min_cost_connect_points_fast))
+    print(f"{'points':>9} " + ' '.join(f"{name:>10}" for name, _ in runs))
+    for n in sizes:
+        rng = random.Random(n)
+        points = [[rng.randint(-10**6, 10**6), rng.randint(-10**6, 10**6)]
+                  for _ in range(n)]
+        results, cells = set(), []
+        for name, fn in runs:
+            if n > LIMITS[name]:
+                cells.append(f"{'skipped':>10}")
+                continue
+            cost, seconds = timed(fn, [p[:] for p in points])
+            results.add(cost)
+            cells.append(f"{seconds:9.2f}s")
+        assert len(results) == 1, results
+        print(f"{n:>9} " + ' '.join(cells))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+"""
+ContractionHierarchy vs plain dijkstra() (AdvGraphs/03_dijkstras_algorithm.py).
+
+    python benchmarks/contraction_hierarchy.py [side] [queries]
+
+Builds the index on a side x side grid road network with random
+weights, saves it, then answers random s-t queries with both and checks
+they agree. Reports preprocessing time, index size and query speedup.
+"""
+
+import os
+import random
+import tempfile
+
+from bench_utils import arg, load, timed
+
+dij = load('AdvGraphs/03_dijkstras_algorithm.py', 'dijkstras')
+
+
+def grid_graph(side, seed=0):
+    rng = random.Random(seed)
+    n = side * side
+    graph = [[] for _ in range(n)]
+    for r in range(side):
+        for c in range(side):
+            u = r * side + c
+            for v in ((u + 1) if c + 1 < side else None,
+                      (u + side) if r + 1 < side else None):
+                if v is not None:
+                    w = rng.randint(1, 100)
+                    graph[u].append((v, w))
+                    graph[v].append((u, w))
+    return n, graph
+
+
+def main():
+    side, queries = arg(1, 60), arg(2, 200)
+    n, graph = grid_graph(side)
+    rng = random.Random(1)
+    pairs = [(rng.randrange(n), rng.randrange(n)) for _ in range(queries)]
+
+    ch, build = timed(dij.ContractionHierarchy, graph, n)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'ch.json')
+        ch.save(path)
+        size = os.path.getsize(path)
+    index_edges = sum(map(len, ch.up)) + sum(map(len, ch.down))
+    graph_edges = sum(map(len, graph))
+
+    expected, t_dijkstra = timed(lambda: [dij.dijkstra(graph, s, n)[t] for s, t in pairs])
+    got, t_ch = timed(lambda: [ch.query(s, t) for s, t in pairs])
+    assert got == expected
+
+    print(f"{side}x{side} grid: n={n} edges={graph_edges}")
+    print(f"preprocessing   {build:8.2f}s")
+    print(f"index           {index_edges} edges ({index_edges / graph_edges:.2f}x graph), "
+          f"{size / 2**20:.1f} MB JSON")
+    print(f"dijkstra        {t_dijkstra / queries * 1e3:8.2f} ms/query")
+    print(f"CH              {t_ch / queries * 1e3:8.2f} ms/query  "
+          f"speedup {t_dijkstra / t_ch:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+"""
+dijkstra() over an adjacency list vs dijkstra_csr() over a CSRGraph
+(AdvGraphs/03_dijkstras_algorithm.py).
+
+    python benchmarks/csr_dijkstra.py [n] [m]
+
+Each variant runs in its own process so peak RSS is not shared.
+Reports build time, search time, edges per second, peak RSS and RSS
+at the end (for CSR the adjacency list it was built from is gone).
+"""
+
+import subprocess
+import sys
+
+from bench_utils import (adjacency, arg, current_rss_mb, load, peak_rss_mb,
+                         random_edges, timed)
+
+
+def child(mode, n, m):
+    dij = load('AdvGraphs/03_dijkstras_algorithm.py', 'dijkstras')
+    from graph_helpers import CSRGraph
+
+    edges = random_edges(n, m)
+    graph, build = timed(adjacency, n, edges)
+    del edges
+    if mode == 'csr':
+        graph, convert = timed(CSRGraph, n, graph)
+        build += convert
+        dist, search = timed(dij.dijkstra_csr, graph, 0)
+    else:
+        dist, search = timed(dij.dijkstra, graph, 0, n)
+    print(f"{mode:<10} build {build:6.2f}s  search {search:6.2f}s  "
+          f"{m / search / 1e6:5.2f}M edges/s  peak RSS {peak_rss_mb():7.1f} MB  "
+          f"RSS at end {current_rss_mb():7.1f} MB  checksum {sum(dist):.0f}")
+
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == '--child':
+        child(sys.argv[2], int(sys.argv[3]), int(sys.argv[4]))
+        return
+    n, m = arg(1, 100_000), arg(2, 600_000)
+    print(f"n={n} m={m}")
+    for mode in ('adjacency', 'csr'):
+        subprocess.run([sys.executable, __file__, '--child', mode, str(n), str(m)],
+                       check=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+"""
+Makespan of a 100k-task DAG (AdvGraphs/01_topological_sort.py):
+sequential in topological order, wave by wave on a pool
+(topological_waves() + map, a barrier after every wave), and run_dag()
+(critical path first, no barriers).
+
+    python benchmarks/dag_makespan.py [tasks] [workers] [mean_ms]
+
+Each task sleeps for a random duration (mean mean_ms), standing in for
+I/O-bound work; every node gets up to 3 prerequisites among the 200
+nodes before it.
+"""
+
+import functools
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from bench_utils import arg, load, timed
+
+topo = load('AdvGraphs/01_topological_sort.py', 'topological_sort')
+
+
+def random_dag(n, seed=0):
+    rng = random.Random(seed)
+    edges = []
+    for v in range(1, n):
+        for u in rng.sample(range(max(0, v - 200), v), min(v, rng.randint(0, 3))):
+            edges.append((u, v))
+    return edges
+
+
+def main():
+    n, workers, mean_ms = arg(1, 100_000), arg(2, 8), arg(3, 1.0, float)
+    edges = random_dag(n)
+    rng = random.Random(1)
+    cost = [rng.expovariate(1 / mean_ms) / 1000 for _ in range(n)]
+    tasks = [functools.partial(time.sleep, c) for c in cost]
+    waves = list(topo.topological_waves(n, edges))
+    print(f"tasks={n} edges={len(edges)} waves={len(waves)} workers={workers} "
+          f"total work {sum(cost):.1f}s, critical path "
+          f"{max(topo.critical_path_lengths(n, edges, cost)):.2f}s")
+
+    _, t_seq = timed(lambda: [tasks[u]() for u in topo.topological_sort_kahn(n, edges)])
+    print(f"sequential      {t_seq:7.2f}s")
+
+    def run_waves():
+        with ThreadPoolExecutor(workers) as pool:
+            for wave in waves:
+                list(pool.map(lambda u: tasks[u](), wave))
+    _, t_waves = timed(run_waves)
+    print(f"waves + map     {t_waves:7.2f}s  speedup {t_seq / t_waves:5.2f}")
+
+    results, t_dag = timed(topo.run_dag, n, edges, tasks, workers, cost)
+    assert len(results) == n
+    print(f"run_dag         {t_dag:7.2f}s  speedup {t_seq / t_dag:5.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,39 @@
+"""
+dijkstra() vs dijkstra_auto() and a reused AutoDijkstra
+(AdvGraphs/03_dijkstras_algorithm.py) for three weight ranges.
+
+    python benchmarks/dijkstra_auto.py [n] [m] [sources]
+
+auto = one dijkstra_auto() call per source (weights scanned each time);
+reused = one AutoDijkstra, then distances() per source.
+"""
+
+import random
+
+from bench_utils import adjacency, arg, load, random_edges, timed
+
+dij = load('AdvGraphs/03_dijkstras_algorithm.py', 'dijkstras')
+
+
+def main():
+    n, m, sources = arg(1, 100_000), arg(2, 600_000), arg(3, 3)
+    starts = random.Random(0).sample(range(n), sources)
+    print(f"n={n} m={m} sources={sources}, seconds per source")
+    print(f"{'weights':<10} {'dijkstra':>9} {'auto':>9} {'reused':>9}")
+    for label, low, high in (('0/1', 0, 1), ('1..10', 1, 10), ('1..1000', 1, 1000)):
+        edges = [(u, v, random.Random(u * 31 + v).randint(low, high))
+                 for u, v, _ in random_edges(n, m)]
+        graph = adjacency(n, edges)
+
+        expected, t_heap = timed(lambda: [dij.dijkstra(graph, s, n) for s in starts])
+        got, t_auto = timed(lambda: [dij.dijkstra_auto(graph, s, n) for s in starts])
+        assert got == expected
+        got, t_reused = timed(lambda: [q.distances(s) for q in [dij.AutoDijkstra(graph, n)]
+                                       for s in starts])
+        assert got == expected
+        print(f"{label:<10} {t_heap / sources:9.2f} {t_auto / sources:9.2f} "
+              f"{t_reused / sources:9.2f}")
+
+
+if __name__ == '__main__':
+    main()
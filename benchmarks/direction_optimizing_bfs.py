@@ -0,0 +1,95 @@
+"""
+direction_optimizing_bfs() (Graphs/02_bfs.py) vs plain BFS on an R-MAT
+graph (skewed degrees, small diameter: the case bottom-up levels are
+for).
+
+    python benchmarks/direction_optimizing_bfs.py [scale] [edge_factor] [sources]
+
+n = 2**scale nodes, edge_factor * n directed edges, R-MAT quadrant
+probabilities (0.57, 0.19, 0.19, 0.05). Rows:
+- deque BFS: the textbook queue over adjacency lists
+- CSR top-down: direction_optimizing_bfs with alpha = inf (never
+  switches), isolating the bitmap/CSR part
+- direction-optimizing: default alpha/beta
+All three must agree on every distance.
+"""
+
+import random
+from collections import deque
+
+from bench_utils import arg, load, timed
+from graph_helpers import CSRGraph
+
+bfs = load('Graphs/02_bfs.py', 'bfs')
+
+
+def rmat_edges(scale, m, seed=0, a=0.57, b=0.19, c=0.19):
+    rng = random.Random(seed)
+    edges = []
+    for _ in range(m):
+        u = v = 0
+        for _ in range(scale):
+            r = rng.random()
+            u, v = u << 1, v << 1
+            if r < a:
+                pass
+            elif r < a + b:
+                v |= 1
+            elif r < a + b + c:
+                u |= 1
+            else:
+                u |= 1
+                v |= 1
+        edges.append((u, v))
+    return edges
+
+
+def deque_bfs(graph, source, n):
+    dist = [-1] * n
+    dist[source] = 0
+    queue = deque([source])
+    while queue:
+        u = queue.popleft()
+        for v in graph[u]:
+            if dist[v] == -1:
+                dist[v] = dist[u] + 1
+                queue.append(v)
+    return dist
+
+
+def main():
+    scale, edge_factor, sources = arg(1, 16), arg(2, 16), arg(3, 4)
+    n = 1 << scale
+    edges = rmat_edges(scale, edge_factor * n)
+    graph = [[] for _ in range(n)]
+    for u, v in edges:
+        graph[u].append(v)
+    csr = CSRGraph(n, graph, weighted=False)
+    reverse = csr.reverse()
+
+    # Sources with out-edges, so every search reaches the giant component
+    rng = random.Random(1)
+    starts = []
+    while len(starts) < sources:
+        s = rng.randrange(n)
+        if graph[s]:
+            starts.append(s)
+    print(f"R-MAT scale {scale}: n={n} m={len(edges)}, {sources} sources")
+
+    runs = (('deque BFS', lambda s: deque_bfs(graph, s, n)),
+            ('CSR top-down', lambda s: list(bfs.direction_optimizing_bfs(
+                csr, s, reverse, alpha=float('inf'))[0])),
+            ('direction-optimizing', lambda s: list(bfs.direction_optimizing_bfs(
+                csr, s, reverse)[0])))
+    results = []
+    for label, run in runs:
+        dists, seconds = timed(lambda: [run(s) for s in starts])
+        results.append(dists)
+        reached = sum(d >= 0 for d in dists[0])
+        print(f"{label:<21} {seconds / sources:6.2f}s per search  "
+              f"(reached {reached}, depth {max(dists[0])})")
+    assert results[0] == results[1] == results[2]
+
+
+if __name__ == '__main__':
+    main()
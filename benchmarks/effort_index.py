@@ -0,0 +1,61 @@
+"""
+EffortIndex (Graphs/07_valid_path.py): build time, binary-lifting
+levels and query throughput on a random side x side height grid.
+
+    python benchmarks/effort_index.py [side] [queries]
+
+Levels are sized by the Kruskal tree's depth, not its node count;
+the line 'levels' shows both. Up to side 500 the first 20 queries are
+checked against a minimax Dijkstra over the whole grid.
+"""
+
+import heapq
+import random
+
+from bench_utils import arg, current_rss_mb, load, timed
+
+vp = load('Graphs/07_valid_path.py', 'valid_path')
+
+
+def minimax_effort(heights, source, target):
+    """Smallest max step |h| over grid paths source -> target."""
+    rows, cols = len(heights), len(heights[0])
+    best = {source: 0}
+    heap = [(0, source)]
+    while heap:
+        effort, (r, c) = heapq.heappop(heap)
+        if (r, c) == target:
+            return effort
+        if effort > best[(r, c)]:
+            continue
+        for nr, nc in ((r + 1, c), (r - 1, c), (r, c + 1), (r, c - 1)):
+            if 0 <= nr < rows and 0 <= nc < cols:
+                e = max(effort, abs(heights[nr][nc] - heights[r][c]))
+                if e < best.get((nr, nc), float('inf')):
+                    best[(nr, nc)] = e
+                    heapq.heappush(heap, (e, (nr, nc)))
+
+
+def main():
+    side, queries = arg(1, 2000), arg(2, 1_000_000)
+    rng = random.Random(0)
+    heights = [[rng.randint(0, 10**6) for _ in range(side)] for _ in range(side)]
+    base = current_rss_mb()
+
+    index, t_build = timed(vp.EffortIndex, heights)
+    size = len(index.depth)
+    print(f"{side}x{side} grid: build {t_build:.2f}s, +{current_rss_mb() - base:.0f} MB")
+    print(f"levels {len(index.up)} (tree depth {max(index.depth)}; "
+          f"{max(1, (size - 1).bit_length()) + 1} if sized by node count)")
+
+    cells = [(rng.randrange(side), rng.randrange(side)) for _ in range(2 * queries)]
+    pairs = list(zip(cells[::2], cells[1::2]))
+    answers, t_query = timed(lambda: [index.query(a, b) for a, b in pairs])
+    print(f"{queries} queries: {t_query:.2f}s ({queries / t_query / 1e3:.0f}k/s)")
+    if side <= 500:
+        for (a, b), got in list(zip(pairs, answers))[:20]:
+            assert got == minimax_effort(heights, a, b), (a, b)
+        print("first 20 answers match minimax Dijkstra")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+"""
+Lazy heapq vs IndexedMinHeap (graph_helpers.py) for Dijkstra and Prim
+(AdvGraphs/03_dijkstras_algorithm.py, AdvGraphs/04_kruskal_prims.py).
+
+    python benchmarks/indexed_heap.py [n] [degrees...]
+
+For each average degree, times dijkstra() vs dijkstra_indexed() and
+prim() vs prim_indexed() on one random graph, then reruns each under
+tracemalloc for peak Python allocation. The dijkstra figures exclude
+the input graph; prim() builds its own adjacency, so its figures
+include it.
+"""
+
+import sys
+import tracemalloc
+
+from bench_utils import adjacency, arg, load, random_edges, timed
+
+dij = load('AdvGraphs/03_dijkstras_algorithm.py', 'dijkstras')
+mst = load('AdvGraphs/04_kruskal_prims.py', 'kruskal_prims')
+
+
+def peak_mb(fn, *args):
+    tracemalloc.start()
+    fn(*args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 2**20
+
+
+def main():
+    n = arg(1, 2000)
+    degrees = [int(x) for x in sys.argv[2:]] or [4, 16, 64, 256, 1000]
+    print(f"n={n}")
+    print(f"{'degree':>6} {'algorithm':<10} {'lazy s':>8} {'indexed s':>9} "
+          f"{'lazy MB':>8} {'indexed MB':>10}")
+    for degree in degrees:
+        edges = random_edges(n, n * degree, max_weight=10**6, seed=degree)
+        graph = adjacency(n, edges)
+        runs = (('dijkstra', dij.dijkstra, dij.dijkstra_indexed, (graph, 0, n)),
+                ('prim', mst.prim, mst.prim_indexed, (n, edges)))
+        for name, lazy, indexed, args in runs:
+            a, t_lazy = timed(lazy, *args)
+            b, t_indexed = timed(indexed, *args)
+            assert a == b, name
+            print(f"{degree:>6} {name:<10} {t_lazy:8.2f} {t_indexed:9.2f} "
+                  f"{peak_mb(lazy, *args):8.1f} {peak_mb(indexed, *args):10.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""
+Yen's k_shortest_paths (AdvGraphs/03_dijkstras_algorithm.py) with and
+without spur-path reuse, k = 10 on a random 100k-node road-like graph.
+
+    python benchmarks/k_shortest_paths.py [n] [k] [queries]
+
+The baseline is the previous loop: a fresh dijkstra_path() for every
+spur. The current version first follows the reverse shortest-path tree
+from the spur node and only searches (A*, tree distances as potential)
+when that path hits a ban. Both must return the same costs.
+"""
+
+import heapq
+import random
+
+from bench_utils import adjacency, arg, load, random_edges, timed
+
+dij = load('AdvGraphs/03_dijkstras_algorithm.py', 'dijkstras')
+
+
+def previous_k_shortest_paths(graph, start, target, n, k):
+    """The loop as it was: one plain Dijkstra per spur node."""
+    weight_of = {}
+    for u in range(n):
+        for v, weight in graph[u]:
+            if weight < weight_of.get((u, v), float('inf')):
+                weight_of[(u, v)] = weight
+    cost, path = dij.dijkstra_path(graph, start, target, n)
+    if not path:
+        return []
+    accepted, candidates, seen = [(cost, path)], [], {tuple(path)}
+    while len(accepted) < k:
+        _, last = accepted[-1]
+        root_cost = 0
+        for i in range(len(last) - 1):
+            root = last[:i + 1]
+            banned_edges = {(p[i], p[i + 1]) for _, p in accepted
+                            if len(p) > i + 1 and p[:i + 1] == root}
+            spur_cost, spur = dij.dijkstra_path(graph, last[i], target, n,
+                                                set(root[:-1]), banned_edges)
+            if spur and tuple(root[:-1] + spur) not in seen:
+                seen.add(tuple(root[:-1] + spur))
+                heapq.heappush(candidates, (root_cost + spur_cost, root[:-1] + spur))
+            root_cost += weight_of[(last[i], last[i + 1])]
+        if not candidates:
+            break
+        accepted.append(heapq.heappop(candidates))
+    return accepted
+
+
+def main():
+    n, k, queries = arg(1, 100_000), arg(2, 10), arg(3, 3)
+    graph = adjacency(n, random_edges(n, 3 * n, max_weight=100), undirected=True)
+    rng = random.Random(1)
+    pairs = [(rng.randrange(n), rng.randrange(n)) for _ in range(queries)]
+    print(f"n={n} m={3 * n} undirected, k={k}, {queries} queries")
+
+    totals = {}
+    for label, fn in (('previous', previous_k_shortest_paths),
+                      ('tree reuse', dij.k_shortest_paths)):
+        results, seconds = timed(lambda: [fn(graph, s, t, n, k) for s, t in pairs])
+        totals[label] = [[cost for cost, _ in paths] for paths in results]
+        print(f"{label:<11} {seconds / queries:7.2f}s per query")
+    assert totals['previous'] == totals['tree reuse']
+    print("costs match")
+
+
+if __name__ == '__main__':
+    main()
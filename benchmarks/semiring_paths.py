@@ -0,0 +1,85 @@
+"""
+Accuracy and throughput of semiring_path() (graph_helpers.py) on a
+1M-edge random graph.
+
+    python benchmarks/semiring_paths.py [n] [m]
+
+Accuracy: every semiring is checked against a direct heap search in
+its native arithmetic (products of probabilities, max of minimum
+widths, min of maximum weights) from the same source to every node.
+For max_times the direct products underflow to 0.0 on long paths while
+the log-space value stays usable; those nodes are counted separately.
+Throughput: edges per second of one full single-source run.
+"""
+
+import heapq
+import math
+import random
+
+from bench_utils import adjacency, arg, random_edges, timed
+from graph_helpers import semiring_path
+
+
+def direct_best(graph, start, n, better, extend, start_value, worst):
+    """Best-first search in native arithmetic; better(a, b): a beats b."""
+    best = [worst] * n
+    best[start] = start_value
+    # heapq is a min-heap: store keys so the best value pops first
+    sign = -1 if better(1, 0) else 1
+    heap = [(sign * start_value, start)]
+    while heap:
+        key, u = heapq.heappop(heap)
+        value = sign * key
+        if value != best[u]:
+            continue
+        for v, w in graph[u]:
+            nv = extend(value, w)
+            if better(nv, best[v]):
+                best[v] = nv
+                heapq.heappush(heap, (sign * nv, v))
+    return best
+
+
+def main():
+    n, m = arg(1, 200_000), arg(2, 1_000_000)
+    rng = random.Random(2)
+    weighted = random_edges(n, m // 2, max_weight=1000)
+    probs = [(u, v, rng.uniform(0.5, 1.0)) for u, v, _ in weighted]
+    graph_w = adjacency(n, weighted, undirected=True)
+    graph_p = adjacency(n, probs, undirected=True)
+    print(f"n={n} m={m} (undirected {m // 2} x 2)")
+
+    inf = float('inf')
+    checks = (
+        ('min_plus', weighted, graph_w,
+         (lambda a, b: a < b, lambda d, w: d + w, 0, inf)),
+        ('max_times', probs, graph_p,
+         (lambda a, b: a > b, lambda d, w: d * w, 1.0, 0.0)),
+        ('max_min', weighted, graph_w,
+         (lambda a, b: a > b, min, inf, -inf)),
+        ('min_max', weighted, graph_w,
+         (lambda a, b: a < b, max, 0, inf)),
+    )
+    for semiring, edges, graph, native in checks:
+        values, seconds = timed(semiring_path, n, edges, 0, None, semiring)
+        expected = direct_best(graph, 0, n, *native)
+        worst_rel, underflow = 0.0, 0
+        for got, want in zip(values, expected):
+            if semiring == 'max_times' and want == 0.0 and got > 0.0:
+                underflow += 1
+            elif got != want:
+                worst_rel = max(worst_rel, abs(got - want) / abs(want))
+        note = f"  direct product underflowed at {underflow} nodes" if underflow else ""
+        print(f"{semiring:<10} {m / seconds / 1e6:5.2f}M edges/s ({seconds:5.2f}s)  "
+              f"max rel error {worst_rel:.1e}{note}")
+        assert worst_rel < 1e-9, semiring
+
+    # A 2000-edge chain at p = 0.5: 0.5**2000 underflows a double
+    chain = [(i, i + 1, 0.5) for i in range(2000)]
+    log_value = semiring_path(2001, chain, 0, 2000, 'max_times_log')
+    print(f"chain of 2000 x 0.5: log10 p = {log_value / math.log(10):.1f} "
+          f"(direct product {0.5 ** 2000})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+"""
+Shared UnionFind (graph_helpers.py) vs the recursive list-backed class
+AdvGraphs/02_union_find.py had before, on one random edge stream.
+
+    python benchmarks/union_find_stream.py [n] [m]
+
+Edges are pre-generated into two array('i') columns, so only the
+union-find work is timed. Reports unions/s for the loop and for
+union_many(), find_many() over every node, and the size of the
+parent/size (or parent/rank) storage.
+"""
+
+import random
+import sys
+from array import array
+
+from bench_utils import arg, timed
+from graph_helpers import UnionFind
+
+
+class PreviousUnionFind:
+    """The class as it was: recursive find, list parent/rank."""
+    def __init__(self, n):
+        self.parent = list(range(n))
+        self.rank = [0] * n
+        self.count = n
+
+    def find(self, x):
+        if self.parent[x] != x:
+            self.parent[x] = self.find(self.parent[x])
+        return self.parent[x]
+
+    def union(self, x, y):
+        px, py = self.find(x), self.find(y)
+        if px == py:
+            return False
+        if self.rank[px] < self.rank[py]:
+            px, py = py, px
+        self.parent[py] = px
+        if self.rank[px] == self.rank[py]:
+            self.rank[px] += 1
+        self.count -= 1
+        return True
+
+
+def union_loop(uf, us, vs):
+    union = uf.union
+    for x, y in zip(us, vs):
+        union(x, y)
+    return uf.count
+
+
+def storage_mb(uf):
+    other = uf.size if hasattr(uf, 'size') else uf.rank
+    total = 0
+    for seq in (uf.parent, other):
+        if isinstance(seq, array):
+            total += seq.itemsize * len(seq)
+        else:  # list: 8-byte pointer per slot + the int objects
+            total += sys.getsizeof(seq) + sum(sys.getsizeof(x) for x in set(seq))
+    return total / 2**20
+
+
+def main():
+    n, m = arg(1, 1_000_000), arg(2, 10_000_000)
+    rng = random.Random(0)
+    us = array('i', (rng.randrange(n) for _ in range(m)))
+    vs = array('i', (rng.randrange(n) for _ in range(m)))
+    print(f"n={n} m={m}")
+
+    runs = (('previous, union loop', PreviousUnionFind, union_loop),
+            ('shared, union loop', UnionFind, union_loop),
+            ('shared, union_many', UnionFind,
+             lambda uf, us, vs: (uf.union_many(zip(us, vs)), uf.count)[1]))
+    counts = set()
+    for label, cls, run in runs:
+        uf = cls(n)
+        count, seconds = timed(run, uf, us, vs)
+        counts.add(count)
+        _, t_find = timed(lambda: [uf.find(x) for x in range(n)] if cls is PreviousUnionFind
+                          else uf.find_many(range(n)))
+        print(f"{label:<22} {seconds:6.2f}s  {m / seconds / 1e6:5.2f}M unions/s  "
+              f"find all {t_find:5.2f}s  storage {storage_mb(uf):6.1f} MB")
+    assert len(counts) == 1, counts
+    print(f"components {counts.pop()}")
+
+
+if __name__ == '__main__':
+    main()
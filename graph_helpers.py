@@ -0,0 +1,442 @@
+"""
+SHARED GRAPH BUILDING BLOCKS
+============================
+
+Helpers used by several pattern files (AdvGraphs/, Graphs/).
+Pattern files load this module with:
+
+    _ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    if sys.path[:1] != [_ROOT]:
+        sys.path.insert(0, _ROOT)
+    from graph_helpers import ...
+
+Inserting at the front means this file wins over any other
+graph_helpers module on sys.path.
+
+Every builder takes the node count n first.
+"""
+
+import heapq
+import math
+import operator
+from array import array
+
+# ============================================
+# CSR (Compressed Sparse Row) Graph
+# ============================================
+class CSRGraph:
+    """
+    The out-edges of u are targets[offsets[u]:offsets[u + 1]], with
+    matching weights (None if unweighted) and edge_ids (index of the
+    input edge each slot came from; only set by from_edges()).
+    Three flat arrays instead of a list of tuples per node.
+    """
+    def __init__(self, n, graph=None, weighted=True):
+        """
+        Build in one pass from an adjacency list (list of lists or dict):
+        graph[u] = [(v, weight), ...], or [v, ...] if not weighted.
+        """
+        self.n = n
+        self.offsets = array('q', [0]) * (n + 1)
+        self.targets = array('q')
+        self.weights = array('d') if weighted else None
+        self.edge_ids = None
+        if graph is None:
+            return
+
+        is_dict = isinstance(graph, dict)
+        for u in range(n):
+            for item in (graph.get(u, ()) if is_dict else graph[u]):
+                if weighted:
+                    v, weight = item
+                    self.targets.append(v)
+                    self.weights.append(weight)
+                else:
+                    self.targets.append(item)
+            self.offsets[u + 1] = len(self.targets)
+
+    @classmethod
+    def from_edges(cls, n, edges, directed=True):
+        """
+        Build from edges = [(u, v), ...] or [(u, v, weight), ...].
+        Undirected edges fill both directions with the same edge id,
+        so parallel edges stay distinguishable from each other.
+        """
+        weighted = bool(edges) and len(edges[0]) == 3
+        csr = cls(n, weighted=weighted)
+
+        # Count out-degrees, prefix-sum into offsets, then fill
+        offsets = csr.offsets
+        for edge in edges:
+            offsets[edge[0] + 1] += 1
+            if not directed:
+                offsets[edge[1] + 1] += 1
+        for u in range(n):
+            offsets[u + 1] += offsets[u]
+
+        slots = offsets[n]
+        csr.targets = array('q', [0]) * slots
+        csr.edge_ids = array('q', [0]) * slots
+        if weighted:
+            csr.weights = array('d', [0.0]) * slots
+
+        fill = offsets[:n]
+        for e, edge in enumerate(edges):
+            u, v = edge[0], edge[1]
+            for a, b in ((u, v), (v, u)) if not directed else ((u, v),):
+                i = fill[a]
+                csr.targets[i] = b
+                csr.edge_ids[i] = e
+                if weighted:
+                    csr.weights[i] = edge[2]
+                fill[a] += 1
+
+        return csr
+
+    def reverse(self):
+        """Graph with every edge flipped (in-edges become out-edges)."""
+        edges = []
+        for u in range(self.n):
+            for i in range(self.offsets[u], self.offsets[u + 1]):
+                if self.weights is None:
+                    edges.append((self.targets[i], u))
+                else:
+                    edges.append((self.targets[i], u, self.weights[i]))
+        rev = CSRGraph.from_edges(self.n, edges)
+        if self.weights is not None and rev.weights is None:
+            rev.weights = array('d')  # Weighted graph with no edges
+        return rev
+
+
+# ============================================
+# Union-Find (Path Halving + Union by Size)
+# ============================================
+class UnionFind:
+    def __init__(self, n):
+        self.parent = array('i', range(n))
+        self.size = array('i', [1]) * n
+        self.count = n  # Number of components
+
+    def find(self, x):
+        """Find root with path halving (iterative, no recursion limit)."""
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]  # Point to grandparent
+            x = parent[x]
+        return x
+
+    def union(self, x, y):
+        """Union by size. Returns True if merged."""
+        px, py = self.find(x), self.find(y)
+        if px == py:
+            return False
+
+        # Attach smaller tree under larger
+        if self.size[px] < self.size[py]:
+            px, py = py, px
+        self.parent[py] = px
+        self.size[px] += self.size[py]
+
+        self.count -= 1
+        return True
+
+    def connected(self, x, y):
+        """Check if x and y are in same set."""
+        return self.find(x) == self.find(y)
+
+    def union_many(self, edges):
+        """
+        Union every (x, y) pair. Returns number of merges.
+        Same steps as union(), inlined: no method calls per edge.
+        """
+        parent, size = self.parent, self.size
+        merged = 0
+        for x, y in edges:
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            while parent[y] != y:
+                parent[y] = parent[parent[y]]
+                y = parent[y]
+            if x == y:
+                continue
+            if size[x] < size[y]:
+                x, y = y, x
+            parent[y] = x
+            size[x] += size[y]
+            merged += 1
+        self.count -= merged
+        return merged
+
+    def find_many(self, xs):
+        """Roots for a batch of elements (find() inlined)."""
+        parent = self.parent
+        roots = []
+        for x in xs:
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            roots.append(x)
+        return roots
+
+    def labels(self):
+        """Component label 0..count-1 for every element."""
+        roots = {}
+        return [roots.setdefault(self.find(x), len(roots))
+                for x in range(len(self.parent))]
+
+
+# ============================================
+# Indexed Min-Heap (Decrease-Key)
+# ============================================
+class IndexedMinHeap:
+    """
+    d-ary min-heap over items 0..n-1 with true decrease_key.
+    pos[i] = index of item i in heap (-1 if absent), so each item
+    appears at most once and the heap never holds more than n entries.
+    key is a plain list, so int keys stay exact ints (no float rounding
+    above 2**53).
+    """
+    def __init__(self, n, d=2):
+        self.d = d
+        self.heap = array('q')
+        self.pos = array('q', [-1]) * n
+        self.key = [0] * n
+
+    def __len__(self):
+        return len(self.heap)
+
+    def __contains__(self, i):
+        return self.pos[i] != -1
+
+    def push(self, i, key):
+        """Insert item i, or lower its key if already present."""
+        if self.pos[i] != -1:
+            self.decrease_key(i, key)
+            return
+        self.key[i] = key
+        self.heap.append(i)
+        self.pos[i] = len(self.heap) - 1
+        self._sift_up(len(self.heap) - 1)
+
+    def decrease_key(self, i, key):
+        if key < self.key[i]:
+            self.key[i] = key
+            self._sift_up(self.pos[i])
+
+    def pop(self):
+        """Remove and return (item, key) with the smallest key."""
+        heap, pos = self.heap, self.pos
+        top = heap[0]
+        last = heap.pop()
+        pos[top] = -1
+        if heap:
+            heap[0] = last
+            pos[last] = 0
+            self._sift_down(0)
+        return top, self.key[top]
+
+    def _sift_up(self, idx):
+        heap, pos, key, d = self.heap, self.pos, self.key, self.d
+        item = heap[idx]
+        while idx > 0:
+            parent = (idx - 1) // d
+            if key[heap[parent]] <= key[item]:
+                break
+            heap[idx] = heap[parent]
+            pos[heap[idx]] = idx
+            idx = parent
+        heap[idx] = item
+        pos[item] = idx
+
+    def _sift_down(self, idx):
+        heap, pos, key, d = self.heap, self.pos, self.key, self.d
+        size = len(heap)
+        item = heap[idx]
+        while True:
+            first = idx * d + 1
+            if first >= size:
+                break
+            # Smallest of up to d children
+            best = first
+            for child in range(first + 1, min(first + d, size)):
+                if key[heap[child]] < key[heap[best]]:
+                    best = child
+            if key[heap[best]] >= key[item]:
+                break
+            heap[idx] = heap[best]
+            pos[heap[idx]] = idx
+            idx = best
+        heap[idx] = item
+        pos[item] = idx
+
+
+# ============================================
+# Single-Source Shortest Paths (Dijkstra / Bellman-Ford)
+# ============================================
+def dijkstra(graph, start, n):
+    """
+    Shortest distances from start to all nodes, weights >= 0.
+    graph[u] = [(v, weight), ...]
+    """
+    dist = [float('inf')] * n
+    dist[start] = 0
+    heap = [(0, start)]  # (distance, node)
+
+    while heap:
+        d, u = heapq.heappop(heap)
+
+        if d > dist[u]:
+            continue  # Skip outdated entry
+
+        for v, weight in graph[u]:
+            if d + weight < dist[v]:
+                dist[v] = d + weight
+                heapq.heappush(heap, (dist[v], v))
+
+    return dist
+
+
+def bellman_ford(n, edges, start=None):
+    """
+    Shortest distances with negative weights allowed.
+    edges = [(u, v, weight), ...]
+    start=None measures from a virtual node joined to every node by a
+    0-weight edge (Johnson's potentials): every distance starts at 0.
+    Returns None if a negative cycle is reachable.
+    """
+    if start is None:
+        dist = [0] * n
+        rounds = n  # n + 1 nodes with the virtual one
+    else:
+        dist = [float('inf')] * n
+        dist[start] = 0
+        rounds = n - 1
+
+    for _ in range(rounds):
+        changed = False
+        for u, v, weight in edges:
+            if dist[u] + weight < dist[v]:
+                dist[v] = dist[u] + weight
+                changed = True
+        if not changed:
+            return dist
+
+    # Still improvable after the last round = negative cycle
+    for u, v, weight in edges:
+        if dist[u] + weight < dist[v]:
+            return None
+    return dist
+
+
+# ============================================
+# Semiring Shortest Paths (Generalized Dijkstra)
+# ============================================
+# name: (edge weight -> cost, combine costs, start cost, cost -> answer)
+# Every semiring is mapped to "minimize a monotone cost" so one
+# Dijkstra serves all. max_times runs in log space: summing -log(p)
+# never underflows the way multiplying many p < 1 does.
+SEMIRINGS = {
+    'min_plus': (lambda w: w, operator.add, 0, lambda d: d),
+    'max_times': (lambda p: -math.log(p) if p > 0 else float('inf'),
+                  operator.add, 0, lambda d: math.exp(-d)),
+    'max_times_log': (lambda p: -math.log(p) if p > 0 else float('inf'),
+                      operator.add, 0, lambda d: -d),
+    'max_min': (lambda w: -w, max, float('-inf'), lambda d: -d),
+    'min_max': (lambda w: w, max, 0, lambda d: d),
+}
+
+
+def semiring_path(n, edges, start, target=None, semiring='min_plus',
+                  directed=False):
+    """
+    Best path value under a semiring: shortest (min_plus), most
+    reliable (max_times), widest (max_min) or bottleneck (min_max).
+    edges = [(u, v, weight), ...]; costs are packed into a CSRGraph.
+    Stops as soon as target is settled; without target returns the
+    value for every node.
+    """
+    to_cost, combine, start_cost, answer = SEMIRINGS[semiring]
+
+    # Unusable edges (cost inf, e.g. probability 0) never enter the graph
+    costed = []
+    for u, v, w in edges:
+        c = to_cost(w)
+        if c != float('inf'):
+            costed.append((u, v, c))
+    csr = CSRGraph.from_edges(n, costed, directed)
+    offsets, targets, costs = csr.offsets, csr.targets, csr.weights
+
+    dist = [float('inf')] * n
+    dist[start] = start_cost
+    heap = [(start_cost, start)]
+
+    while heap:
+        d, u = heapq.heappop(heap)
+        if d > dist[u]:
+            continue
+        if u == target:
+            break
+
+        for i in range(offsets[u], offsets[u + 1]):
+            v = targets[i]
+            nd = combine(d, costs[i])
+            if nd < dist[v]:
+                dist[v] = nd
+                heapq.heappush(heap, (nd, v))
+
+    if target is not None:
+        return answer(dist[target])
+    return [answer(d) for d in dist]
+
+
+# ============================================
+# Grid Distance Field (Level-Synchronous BFS)
+# ============================================
+def distance_field(rows, cols, sources, passable=None):
+    """
+    Multi-source BFS distances on a rows x cols grid, level by level.
+    passable: flat bytearray (1 = open) of rows * cols, None = all open.
+    Returns flat array('i'): dist[r * cols + c], -1 if unreachable.
+
+    The grid is padded with a ring of walls so a neighbor of flat index
+    i is just i - 1, i + 1, i - width, i + width: no bounds checks.
+    Each level is a flat list of indices, no (r, c, t) tuples.
+    """
+    width = cols + 2
+    size = (rows + 2) * width
+    open_ = bytearray(size)
+    for r in range(rows):
+        base = (r + 1) * width + 1
+        if passable is None:
+            open_[base:base + cols] = b'\x01' * cols
+        else:
+            open_[base:base + cols] = passable[r * cols:(r + 1) * cols]
+
+    dist = array('i', [-1]) * size
+    frontier = []
+    for r, c in sources:
+        i = (r + 1) * width + c + 1
+        if dist[i] == -1:
+            dist[i] = 0
+            frontier.append(i)
+
+    steps = (-1, 1, -width, width)
+    level = 0
+    while frontier:
+        level += 1
+        next_frontier = []
+        for i in frontier:
+            for step in steps:
+                j = i + step
+                if open_[j] and dist[j] == -1:
+                    dist[j] = level
+                    next_frontier.append(j)
+        frontier = next_frontier
+
+    # Drop the padding
+    result = array('i')
+    for r in range(rows):
+        base = (r + 1) * width + 1
+        result.extend(dist[base:base + cols])
+    return result